@@ -11,33 +11,55 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
-from config import get_available_databases, DARK_THEME
+from config import (
+    DARK_THEME,
+    FILTER_TAG_TYPES,
+    GLOBAL_DB_PATH,
+    KEYSET_PAGINATION,
+    USE_GLOBAL_REPLICA,
+)
 from database import (
     get_total_records,
     get_statistics,
     get_distinct_types,
     get_distinct_disciplines,
     get_distinct_cities,
-    get_organizations,
-    get_filtered_count,
+    get_distinct_tags,
+    get_facet_counts,
+    get_organizations_page,
+    get_page_anchors,
+    supports_keyset,
     get_full_organization_data,
+    get_full_organizations_data,
     get_organization_by_id,
     delete_organization,
     delete_organizations,
+    delete_filtered_organizations,
+    get_filtered_count,
 )
+from db_registry import get_available_databases
+from audit_journal import audit_writer, new_batch_id
+from export_jobs import discard_job, start_export
+from federated import federated_search, replica_search
+from pdf_cache import pdf_cache
+from replica import get_stale_sources, start_refresh
+from query_cache import freeze
 from components.header import render_header, render_statistics
 from components.filters import render_filters
 from components.data_table import render_data_table
+from components.global_results import render_global_results, render_partial_results
 from components.edit_dialog import render_edit_dialog
 from components.floating_bar import (
     render_floating_bar,
     render_delete_confirmation,
     render_multi_delete_confirmation,
 )
-from components.pdf_generator import generate_pdf, generate_multi_pdf
+from components.export_status import render_export_status
+from components.pdf_generator import generate_pdf
 from utils.session import (
     init_session_state,
     get_current_filters,
+    get_page_anchor_cache,
     deselect_all_rows,
     set_delete_confirm,
     set_editing_row,
@@ -314,8 +336,8 @@ def handle_single_download(org_id: int):
     )
 
 
-def handle_multi_download():
-    """Handle multi-organization PDF download."""
+def handle_multi_download(output: str = "pdf"):
+    """Start a background export of the selected organizations (PDF or ZIP of PDFs)."""
     available_dbs = get_available_databases()
     country_code = st.session_state.selected_country
 
@@ -330,26 +352,11 @@ def handle_multi_download():
         st.warning("No organizations selected")
         return
 
-    organizations = []
-    for org_id in selected_ids:
-        org = get_full_organization_data(db_path, org_id)
-        if org:
-            organizations.append(org)
-
-    if not organizations:
-        st.error("No organizations found")
-        return
-
-    pdf_buffer = generate_multi_pdf(organizations, country_code)
-    filename = f"organizations_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-
-    st.download_button(
-        label="Download Selected as PDF",
-        data=pdf_buffer,
-        file_name=filename,
-        mime="application/pdf",
-        key=f"download_multi_pdf_{datetime.now().timestamp()}",
-    )
+    # Render in the background; the export panel shows progress and the download
+    discard_job(st.session_state.pdf_export_job)
+    filename = f"organizations_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{output}"
+    st.session_state.pdf_export_job = start_export(db_path, country_code, selected_ids, filename, output)
+    st.rerun()
 
 
 def handle_single_delete(org_id: int):
@@ -380,6 +387,7 @@ def handle_single_delete(org_id: int):
 
     # Delete from database
     delete_organization(db_path, org_id)
+    pdf_cache.invalidate(country_code, [org_id])
 
     st.success(f"Deleted: {org_name}")
     set_delete_confirm(None)
@@ -400,21 +408,20 @@ def handle_multi_delete():
 
     # Collect all records for batch logging
     records_to_log = []
-    for org_id in selected_ids:
-        org = get_full_organization_data(db_path, org_id)
-        if org:
-            org_name = org.get("name_official") or org.get("name_short") or "Unknown"
-            records_to_log.append({
-                "record_id": org_id,
-                "organization_name": org_name,
-                "full_record": org,
-            })
+    for org in get_full_organizations_data(db_path, selected_ids):
+        org_name = org.get("name_official") or org.get("name_short") or "Unknown"
+        records_to_log.append({
+            "record_id": org["id"],
+            "organization_name": org_name,
+            "full_record": org,
+        })
 
     # Log all deletions in a single batch
     if records_to_log:
         log_delete_batch(country_code=country_code, records=records_to_log)
 
     delete_organizations(db_path, selected_ids)
+    pdf_cache.invalidate(country_code, selected_ids)
 
     st.success(f"Deleted {len(selected_ids)} organizations")
     deselect_all_rows()
@@ -422,6 +429,153 @@ def handle_multi_delete():
     st.rerun()
 
 
+def get_current_page(db_path: str, filters: dict) -> tuple:
+    """Fetch the current page and the filtered count, using keyset cursors when possible."""
+    page = st.session_state.current_page
+    per_page = st.session_state.per_page
+    sort_column = st.session_state.sort_column
+    sort_direction = st.session_state.sort_direction
+
+    page_cursor = None
+    offset = (page - 1) * per_page
+    anchors = None
+
+    if KEYSET_PAGINATION and supports_keyset(sort_column):
+        query_key = (
+            db_path,
+            freeze(filters),
+            sort_column,
+            sort_direction,
+            per_page,
+        )
+        anchors = get_page_anchor_cache(query_key)
+        anchors.setdefault(1, None)
+
+        # Jumped to a page we have no cursor for: compute all page anchors in one pass
+        if page not in anchors:
+            all_anchors = get_page_anchors(
+                db_path,
+                **filters,
+                sort_column=sort_column,
+                sort_direction=sort_direction,
+                per_page=per_page,
+            )
+            anchors.update(enumerate(all_anchors, start=1))
+
+        if page in anchors:
+            page_cursor = anchors[page]
+            offset = 0
+
+    organizations, filtered_count = get_organizations_page(
+        db_path,
+        **filters,
+        sort_column=sort_column,
+        sort_direction=sort_direction,
+        limit=per_page,
+        offset=offset,
+        page_cursor=page_cursor,
+    )
+
+    if anchors is not None:
+        # Rows were added or removed since the anchors were computed
+        known_total = st.session_state.page_anchors_total
+        if known_total is not None and known_total != filtered_count:
+            anchors.clear()
+            anchors[1] = None
+            if page_cursor is not None:
+                anchors[page] = page_cursor
+        st.session_state.page_anchors_total = filtered_count
+
+        # Remember where the next page starts so "next" is a cheap seek
+        if len(organizations) == per_page:
+            last = organizations[-1]
+            anchors[page + 1] = (last[sort_column], last["id"])
+
+    return organizations, filtered_count
+
+
+def handle_filtered_delete():
+    """Handle deletion of every organization matching the active filters."""
+    available_dbs = get_available_databases()
+    country_code = st.session_state.selected_country
+
+    if country_code not in available_dbs:
+        st.error("Database not found")
+        return
+
+    db_path = available_dbs[country_code]["path"]
+    filters = get_current_filters()
+    batch_id = new_batch_id()
+
+    # Log the deleted records chunk by chunk once the delete has committed
+    def log_records(records: list):
+        log_delete_batch(
+            country_code=country_code,
+            records=[
+                {
+                    "record_id": org["id"],
+                    "organization_name": org.get("name_official") or org.get("name_short") or "Unknown",
+                    "full_record": org,
+                }
+                for org in records
+            ],
+            batch_id=batch_id,
+        )
+
+    deleted_ids = delete_filtered_organizations(db_path, **filters, on_records=log_records)
+    pdf_cache.invalidate(country_code, deleted_ids)
+
+    st.success(f"Deleted {len(deleted_ids)} organizations")
+    deselect_all_rows()
+    st.session_state.delete_filtered_confirm = False
+    st.rerun()
+
+
+def render_global_search(available_dbs: dict, filters: dict):
+    """Run the current search against all databases and render the merged page.
+
+    Uses the global replica when it exists and is up to date. Otherwise,
+    or if reading the replica fails, every database is queried in parallel;
+    a stale replica is refreshed on a background thread meanwhile.
+    """
+    per_page = st.session_state.per_page
+    page_args = {
+        "sort_column": st.session_state.sort_column,
+        "sort_direction": st.session_state.sort_direction,
+        "limit": per_page,
+        "offset": (st.session_state.current_page - 1) * per_page,
+    }
+
+    result = None
+    if USE_GLOBAL_REPLICA and GLOBAL_DB_PATH.exists():
+        try:
+            if get_stale_sources(available_dbs, GLOBAL_DB_PATH):
+                start_refresh(target=GLOBAL_DB_PATH)
+            else:
+                result = replica_search(str(GLOBAL_DB_PATH), filters, **page_args)
+        except Exception as e:
+            print(f"Error reading the global replica: {e}")
+
+    if result is None:
+        partial_results = st.empty()
+        partial_results.progress(0.0, text="Searching all countries...")
+
+        # Show the page merged so far as each country finishes
+        def on_result(country_code: str, finished: int, total: int, partial: dict):
+            with partial_results.container():
+                render_partial_results(partial["organizations"], finished, total, country_code)
+
+        result = federated_search(available_dbs, filters, **page_args, on_result=on_result)
+        partial_results.empty()
+
+    render_global_results(
+        organizations=result["organizations"],
+        total_count=result["total_count"],
+        country_counts=result["country_counts"],
+        errors=result["errors"],
+    )
+
+
 def main():
     """Main application entry point."""
     # Initialize session state
@@ -461,23 +615,26 @@ def main():
 
     st.divider()
 
-    # Cache filter options
-    if st.session_state.cached_types is None:
-        st.session_state.cached_types = get_distinct_types(db_path)
-    if st.session_state.cached_disciplines is None:
-        st.session_state.cached_disciplines = get_distinct_disciplines(db_path)
-    if st.session_state.cached_cities is None:
-        st.session_state.cached_cities = get_distinct_cities(db_path)
-
-    # Render filters
+    # Render filters (option lists come from the shared query cache)
     render_filters(
-        types=st.session_state.cached_types,
-        disciplines=st.session_state.cached_disciplines,
-        cities=st.session_state.cached_cities,
+        types=get_distinct_types(db_path),
+        disciplines=get_distinct_disciplines(db_path),
+        cities=get_distinct_cities(db_path),
+        tag_options={tag_type: get_distinct_tags(db_path, tag_type) for tag_type in FILTER_TAG_TYPES},
+        facet_counts=get_facet_counts(db_path, **get_current_filters()),
     )
 
     st.divider()
 
+    # Audit entries that could not be written are reported, never lost silently
+    dropped_audit_entries = audit_writer.stats()["dropped"]
+    if dropped_audit_entries:
+        st.warning(f"{dropped_audit_entries:,} audit log entries could not be written. See the server log.")
+
+    # Background PDF export started from the selection bar
+    if st.session_state.pdf_export_job is not None:
+        render_export_status()
+
     # Check if editing
     if st.session_state.editing_row is not None:
         render_edit_dialog(st.session_state.editing_row)
@@ -509,28 +666,22 @@ def main():
     # Get current filters
     filters = get_current_filters()
 
-    # Get filtered count
-    filtered_count = get_filtered_count(
-        db_path,
-        search_term=filters["search_term"],
-        filter_types=filters["filter_types"],
-        filter_disciplines=filters["filter_disciplines"],
-        filter_cities=filters["filter_cities"],
-    )
+    # Check for delete-all-matching confirmation
+    if st.session_state.delete_filtered_confirm:
+        render_multi_delete_confirmation(
+            count=get_filtered_count(db_path, **filters),
+            on_confirm=handle_filtered_delete,
+            on_cancel=lambda: setattr(st.session_state, 'delete_filtered_confirm', False) or st.rerun(),
+        )
+        return
 
-    # Get organizations for current page
-    offset = (st.session_state.current_page - 1) * st.session_state.per_page
-    organizations = get_organizations(
-        db_path,
-        search_term=filters["search_term"],
-        filter_types=filters["filter_types"],
-        filter_disciplines=filters["filter_disciplines"],
-        filter_cities=filters["filter_cities"],
-        sort_column=st.session_state.sort_column,
-        sort_direction=st.session_state.sort_direction,
-        limit=st.session_state.per_page,
-        offset=offset,
-    )
+    # Search across every country database
+    if st.session_state.global_search:
+        render_global_search(available_dbs, filters)
+        return
+
+    # Get organizations for current page together with the filtered count
+    organizations, filtered_count = get_current_page(db_path, filters)
 
     # Get current page IDs for select all
     current_page_ids = [org["id"] for org in organizations]
@@ -540,6 +691,7 @@ def main():
         render_floating_bar(
             current_page_ids=current_page_ids,
             on_download_selected=handle_multi_download,
+            on_download_zip=lambda: handle_multi_download("zip"),
             on_delete_selected=lambda: setattr(st.session_state, 'delete_multi_confirm', True) or st.rerun(),
         )
 
@@ -0,0 +1,667 @@
+"""Append-only audit journal of edits and deletes.
+
+Every audited action is one row of a SQLite table (a delete_batch gives
+one row per organization, sharing a batch id), indexed by country, record
+id, action and time so the history of a record can be queried. Rows can
+only be inserted: triggers reject UPDATE and DELETE.
+
+Entries are normally written by AuditWriter, a background thread that
+batches them, so logging an action costs the caller only a queue put.
+
+With a snapshot interval, edits store only their changes; the full record
+before the edit is kept on every Nth edit of a record as a base snapshot
+(deletes, which hold the full record, are bases as well). Any version of
+a record is rebuilt from the latest base before it plus the changes of
+the edits after it (get_record_version).
+
+The JSON files written to logs/ by earlier versions can be imported once:
+
+    python audit_journal.py import
+    python audit_journal.py history ES 42
+"""
+
+import argparse
+import atexit
+import copy
+import json
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config import (
+    AUDIT_BATCH_SIZE,
+    AUDIT_DB_PATH,
+    AUDIT_ENQUEUE_TIMEOUT,
+    AUDIT_FLUSH_INTERVAL,
+    AUDIT_QUEUE_SIZE,
+    AUDIT_SNAPSHOT_INTERVAL,
+    COUNTRIES,
+    DB_BUSY_TIMEOUT,
+    LOGS_FOLDER,
+    SQLITE_JOURNAL_MODE,
+)
+
+# Actions recorded in the journal
+AUDIT_ACTIONS = ("edit", "delete", "delete_batch", "restore")
+
+# Actions whose entries hold the full record, so they serve as base snapshots
+DELETE_ACTIONS = ("delete", "delete_batch")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    action TEXT NOT NULL,
+    country_code TEXT NOT NULL,
+    record_id INTEGER,
+    organization_name TEXT,
+    batch_id TEXT,
+    payload TEXT NOT NULL,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_audit_record ON audit_entries(country_code, record_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_action ON audit_entries(action, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_entries(timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_batch ON audit_entries(batch_id) WHERE batch_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_audit_source ON audit_entries(source) WHERE source IS NOT NULL;
+CREATE TRIGGER IF NOT EXISTS audit_entries_no_update BEFORE UPDATE ON audit_entries
+BEGIN
+    SELECT RAISE(ABORT, 'audit journal is append-only');
+END;
+CREATE TRIGGER IF NOT EXISTS audit_entries_no_delete BEFORE DELETE ON audit_entries
+BEGIN
+    SELECT RAISE(ABORT, 'audit journal is append-only');
+END;
+"""
+
+# Columns of audit_entries, in INSERT order
+ENTRY_COLUMNS = [
+    "timestamp", "action", "country_code", "record_id",
+    "organization_name", "batch_id", "payload", "source",
+]
+
+
+def make_entry(
+    action: str,
+    country_code: str,
+    record_id: Optional[int],
+    organization_name: Optional[str],
+    payload: Dict[str, Any],
+    timestamp: Optional[str] = None,
+    batch_id: Optional[str] = None,
+    source: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build a journal row; payload holds the action's record data.
+
+    The payload is JSON-encoded when the row is written, possibly on the
+    writer thread, so it must not be changed afterwards.
+    """
+    return {
+        "timestamp": timestamp or datetime.now().isoformat(),
+        "action": action,
+        "country_code": country_code,
+        "record_id": record_id,
+        "organization_name": organization_name,
+        "batch_id": batch_id,
+        "payload": payload,
+        "source": source,
+    }
+
+
+def new_batch_id() -> str:
+    """Create the id shared by the rows of one delete_batch."""
+    return uuid.uuid4().hex
+
+
+def batch_entries(
+    country_code: str,
+    records: List[Dict[str, Any]],
+    timestamp: Optional[str] = None,
+    source: Optional[str] = None,
+    batch_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Build the rows of a delete_batch, one per record, sharing a batch id.
+
+    records are dicts with record_id, organization_name and full_record.
+    A new batch id is used unless one is given, e.g. to log a large batch
+    in several chunks.
+    """
+    timestamp = timestamp or datetime.now().isoformat()
+    batch_id = batch_id or new_batch_id()
+    return [
+        make_entry(
+            "delete_batch",
+            country_code,
+            record.get("record_id"),
+            record.get("organization_name"),
+            {"full_record": record.get("full_record")},
+            timestamp=timestamp,
+            batch_id=batch_id,
+            source=source,
+        )
+        for record in records
+    ]
+
+
+def _set_at(record: Dict[str, Any], key: str, value: Any):
+    """Set a value by its calculate_changes() key, e.g. "tags.disciplines"."""
+    *parents, name = key.split(".")
+    for part in parents:
+        record = record.setdefault(part, {})
+    record[name] = value
+
+
+def _edits_since_base(conn: sqlite3.Connection, country_code: str, record_id: int) -> Optional[int]:
+    """Count the edits of a record logged after its latest base snapshot (None without one)."""
+    cursor = conn.execute(
+        """
+        SELECT action, json_type(payload, '$.full_record_before') IS NOT NULL
+        FROM audit_entries
+        WHERE country_code = ? AND record_id = ?
+        ORDER BY id DESC
+        """,
+        (country_code, record_id),
+    )
+    edits = 0
+    for action, has_snapshot in cursor:
+        if action in DELETE_ACTIONS or (action == "edit" and has_snapshot):
+            return edits
+        if action == "edit":
+            edits += 1
+    return None
+
+
+def _row_to_entry(row: sqlite3.Row) -> Dict[str, Any]:
+    """Turn a journal row into a log entry shaped like the old JSON files."""
+    country_code = row["country_code"]
+    entry = {
+        "id": row["id"],
+        "action": row["action"],
+        "timestamp": row["timestamp"],
+        "database": country_code,
+        "database_name": COUNTRIES.get(country_code, {}).get("name", country_code),
+        "record_id": row["record_id"],
+        "organization_name": row["organization_name"],
+        "batch_id": row["batch_id"],
+    }
+    entry.update(json.loads(row["payload"]))
+    return entry
+
+
+class AuditJournal:
+    """SQLite-backed append-only audit log.
+
+    One connection is shared by all threads behind a lock; the file and
+    schema are created on first use. snapshot_interval is the number of
+    edits per base snapshot of a record (None keeps the full record on
+    every edit).
+    """
+
+    def __init__(self, path: Path, snapshot_interval: Optional[int] = None):
+        self.path = Path(path)
+        self.snapshot_interval = snapshot_interval
+        # Edits since the latest base per (country, record); bases are never
+        # removed, so a stale count only shifts when the next base is taken
+        self._since_base: Dict[Tuple[str, int], int] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the journal, creating it if needed (call with the lock held)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path,
+                timeout=DB_BUSY_TIMEOUT,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute(f"PRAGMA journal_mode = {SQLITE_JOURNAL_MODE}")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _compact_edits(self, conn: sqlite3.Connection, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop full_record_before from edits that are not due for a base snapshot.
+
+        Imported entries are kept as they are.
+        """
+        since_base = self._since_base
+        if len(since_base) > 100000:
+            since_base.clear()
+        compacted = []
+        for entry in entries:
+            key = (entry["country_code"], entry["record_id"])
+            if entry["action"] in DELETE_ACTIONS:
+                since_base[key] = 0
+            elif (
+                entry["action"] == "edit"
+                and entry["source"] is None
+                and "full_record_before" in entry["payload"]
+            ):
+                edits = since_base.get(key)
+                if edits is None:
+                    edits = _edits_since_base(conn, *key)
+                if edits is not None and edits + 1 < self.snapshot_interval:
+                    payload = {
+                        name: value for name, value in entry["payload"].items()
+                        if name != "full_record_before"
+                    }
+                    entry = {**entry, "payload": payload}
+                    since_base[key] = edits + 1
+                else:
+                    since_base[key] = 0
+            compacted.append(entry)
+        return compacted
+
+    def append(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """Insert entries from make_entry() in one transaction; returns the count."""
+        entries = list(entries)
+        if not entries:
+            return 0
+        placeholders = ", ".join("?" for _ in ENTRY_COLUMNS)
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self.snapshot_interval is not None:
+                    entries = self._compact_edits(conn, entries)
+                rows = [
+                    tuple(
+                        json.dumps(entry[column], ensure_ascii=False, default=str, separators=(",", ":"))
+                        if column == "payload" else entry[column]
+                        for column in ENTRY_COLUMNS
+                    )
+                    for entry in entries
+                ]
+                conn.executemany(
+                    f"INSERT INTO audit_entries ({', '.join(ENTRY_COLUMNS)}) VALUES ({placeholders})",
+                    rows,
+                )
+            except BaseException:
+                conn.rollback()
+                # The counts may include snapshots that were not written
+                self._since_base.clear()
+                raise
+            conn.commit()
+        return len(rows)
+
+    def query(
+        self,
+        country_code: Optional[str] = None,
+        record_id: Optional[int] = None,
+        action: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        batch_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Get entries matching every given filter, ordered by time.
+
+        since and until are ISO timestamps (or prefixes such as a date);
+        until is exclusive.
+        """
+        conditions = []
+        params: List[Any] = []
+        for column, value in (
+            ("country_code", country_code),
+            ("record_id", record_id),
+            ("action", action),
+            ("batch_id", batch_id),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("timestamp < ?")
+            params.append(until)
+
+        sql = "SELECT * FROM audit_entries"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        direction = "DESC" if newest_first else "ASC"
+        sql += f" ORDER BY timestamp {direction}, id {direction}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [_row_to_entry(row) for row in rows]
+
+    def get_record_history(self, country_code: str, record_id: int) -> List[Dict[str, Any]]:
+        """Get every edit and delete of one organization, oldest first."""
+        return self.query(country_code=country_code, record_id=record_id)
+
+    def get_entry(self, entry_id: int) -> Optional[Dict[str, Any]]:
+        """Get one entry by its journal id."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT * FROM audit_entries WHERE id = ?", (entry_id,)
+            ).fetchone()
+        return _row_to_entry(row) if row is not None else None
+
+    def get_record_version(
+        self,
+        country_code: str,
+        record_id: int,
+        at: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Rebuild a record as it was at time at (default: after its last logged action).
+
+        Starts from the latest base snapshot up to at and applies the
+        changes of the edits after it. Returns None if the record was
+        deleted at that time or no snapshot precedes at.
+        """
+        record = None
+        deleted = False
+        for entry in self.get_record_history(country_code, record_id):
+            if at is not None and entry["timestamp"] > at:
+                break
+            action = entry["action"]
+            if action in DELETE_ACTIONS:
+                record = entry["full_record"]
+                deleted = True
+            elif action == "restore":
+                deleted = False
+            elif action == "edit":
+                if entry.get("full_record_before") is not None:
+                    record = copy.deepcopy(entry["full_record_before"])
+                if record is not None:
+                    for key, change in entry.get("changes", {}).items():
+                        _set_at(record, key, change["after"])
+        return None if deleted else record
+
+    def get_batch(self, batch_id: str) -> List[Dict[str, Any]]:
+        """Get the per-record entries of one delete_batch."""
+        return self.query(batch_id=batch_id)
+
+    def count(self) -> int:
+        """Number of entries in the journal."""
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM audit_entries").fetchone()[0]
+
+    def _is_imported(self, source: str) -> bool:
+        """Check whether a log file was imported before."""
+        with self._lock:
+            return self._connect().execute(
+                "SELECT 1 FROM audit_entries WHERE source = ? LIMIT 1", (source,)
+            ).fetchone() is not None
+
+    def import_json_logs(self, folder: Optional[Path] = None) -> Dict[str, int]:
+        """Import the one-file-per-action JSON logs of a folder (default LOGS_FOLDER).
+
+        Files are imported in name (time) order and only once; unreadable
+        files are skipped. Returns counts of imported files, entries and
+        skipped files.
+        """
+        folder = Path(folder) if folder is not None else LOGS_FOLDER
+        stats = {"files": 0, "entries": 0, "skipped": 0}
+        if not folder.exists():
+            return stats
+
+        for path in sorted(folder.glob("*.json")):
+            source = path.name
+            if self._is_imported(source):
+                continue
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                entries = _entries_from_log(data, source)
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                print(f"Skipping {source}: {e}")
+                stats["skipped"] += 1
+                continue
+            stats["entries"] += self.append(entries)
+            stats["files"] += 1
+        return stats
+
+    def close(self):
+        """Close the connection; the next call reopens it."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _entries_from_log(data: Dict[str, Any], source: str) -> List[Dict[str, Any]]:
+    """Convert one old JSON log file to journal rows."""
+    action = data["action"]
+    country_code = data["database"]
+    timestamp = data["timestamp"]
+
+    if action == "delete_batch":
+        return batch_entries(country_code, data["records"], timestamp=timestamp, source=source)
+
+    if action == "edit":
+        payload = {
+            "full_record_before": data.get("full_record_before"),
+            "changes": data.get("changes", {}),
+        }
+    elif action == "delete":
+        payload = {"full_record": data.get("full_record")}
+    else:
+        raise ValueError(f"unknown action {action!r}")
+
+    return [make_entry(
+        action,
+        country_code,
+        data.get("record_id"),
+        data.get("organization_name"),
+        payload,
+        timestamp=timestamp,
+        source=source,
+    )]
+
+
+# Queue markers asking the writer thread to stop, or to write its batch now
+_STOP = object()
+_FLUSH = object()
+
+
+class AuditWriter:
+    """Background thread appending queued entries to a journal in batches.
+
+    A batch is written once batch_size entries are waiting or
+    flush_interval seconds after its first entry. When the queue is full,
+    submit() waits for room (counted as backpressure) for at most
+    enqueue_timeout per call, however many entries it was given, and then
+    drops the entries not yet queued (counted as dropped, with a message),
+    so a stalled journal cannot block the UI or a caller's transaction
+    indefinitely.
+    Queued entries are written before the process exits.
+    """
+
+    def __init__(
+        self,
+        journal: AuditJournal,
+        max_queue: int = AUDIT_QUEUE_SIZE,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL,
+        enqueue_timeout: float = AUDIT_ENQUEUE_TIMEOUT,
+    ):
+        self.journal = journal
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+        self._closed = False
+        self.written = 0
+        self.batches = 0
+        self.backpressure = 0
+        self.dropped = 0
+        self.write_errors = 0
+
+    def _count(self, name: str, amount: int = 1):
+        """Increment a counter from any thread."""
+        with self._counter_lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def _ensure_started(self):
+        """Start the writer thread on first use."""
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                    thread.start()
+                    atexit.register(self.close)
+                    self._thread = thread
+
+    def submit(self, entries: Iterable[Dict[str, Any]]) -> bool:
+        """Queue entries for writing; returns False if any had to be dropped.
+
+        After close() entries are written synchronously instead.
+        """
+        if self._closed:
+            self.journal.append(entries)
+            return True
+
+        self._ensure_started()
+        entries = list(entries)
+        deadline = None
+        for index, entry in enumerate(entries):
+            try:
+                self._queue.put_nowait(entry)
+                continue
+            except queue.Full:
+                self._count("backpressure")
+            if deadline is None:
+                deadline = time.monotonic() + self.enqueue_timeout
+            try:
+                self._queue.put(entry, timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                # Out of time: drop this entry and the rest of the call
+                dropped = len(entries) - index
+                self._count("dropped", dropped)
+                print(f"Audit queue full: dropped {dropped} of {len(entries)} entries")
+                return False
+        return True
+
+    def _next_batch(self) -> List[Any]:
+        """Wait for an entry, then collect more until the batch is full or due."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and batch[-1] is not _STOP and batch[-1] is not _FLUSH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, entries: List[Dict[str, Any]]):
+        """Append a batch, retrying once before counting it as dropped."""
+        for attempt in range(2):
+            try:
+                self.journal.append(entries)
+            except Exception as e:
+                self._count("write_errors")
+                if attempt == 0:
+                    time.sleep(0.5)
+                    continue
+                self._count("dropped", len(entries))
+                print(f"Error writing {len(entries)} audit entries: {e}")
+            else:
+                self._count("written", len(entries))
+                self._count("batches")
+            return
+
+    def _run(self):
+        """Writer thread: write batches until asked to stop."""
+        stopping = False
+        while not stopping:
+            batch = self._next_batch()
+            entries = [entry for entry in batch if entry is not _STOP and entry is not _FLUSH]
+            stopping = any(entry is _STOP for entry in batch)
+            if entries:
+                self._write(entries)
+            for _ in batch:
+                self._queue.task_done()
+
+    def flush(self):
+        """Block until every queued entry has been written (or dropped)."""
+        if self._thread is not None:
+            self._queue.put(_FLUSH)
+            self._queue.join()
+
+    def close(self):
+        """Write the queued entries and stop the thread.
+
+        Runs automatically at interpreter exit; later submits are written
+        synchronously.
+        """
+        with self._start_lock:
+            self._closed = True
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join()
+            # Entries queued while the thread was stopping
+            leftovers = []
+            while True:
+                try:
+                    leftovers.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+                self._queue.task_done()
+            leftovers = [entry for entry in leftovers if entry is not _STOP and entry is not _FLUSH]
+            if leftovers:
+                self._write(leftovers)
+
+    def stats(self) -> Dict[str, int]:
+        """Get queue depth and the written, backpressure, dropped and error counters."""
+        with self._counter_lock:
+            return {
+                "queued": self._queue.qsize(),
+                "written": self.written,
+                "batches": self.batches,
+                "backpressure": self.backpressure,
+                "dropped": self.dropped,
+                "write_errors": self.write_errors,
+            }
+
+
+# Process-wide journal and writer shared by all sessions
+audit_journal = AuditJournal(AUDIT_DB_PATH, AUDIT_SNAPSHOT_INTERVAL)
+audit_writer = AuditWriter(audit_journal)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the audit journal or import old JSON logs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import", help="Import logs/*.json files")
+    import_parser.add_argument("--logs-folder", help=f"Folder of JSON logs (default: {LOGS_FOLDER})")
+    history_parser = commands.add_parser("history", help="Show the history of one organization")
+    history_parser.add_argument("country_code")
+    history_parser.add_argument("record_id", type=int)
+    version_parser = commands.add_parser("version", help="Print an organization as it was at a time")
+    version_parser.add_argument("country_code")
+    version_parser.add_argument("record_id", type=int)
+    version_parser.add_argument("--at", help="ISO timestamp (default: latest logged version)")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        stats = audit_journal.import_json_logs(args.logs_folder)
+        print(f"Imported {stats['entries']} entries from {stats['files']} files ({stats['skipped']} skipped)")
+    elif args.command == "version":
+        record = audit_journal.get_record_version(args.country_code.upper(), args.record_id, args.at)
+        print(json.dumps(record, indent=2, ensure_ascii=False, default=str))
+    else:
+        for entry in audit_journal.get_record_history(args.country_code.upper(), args.record_id):
+            changed = ", ".join(entry.get("changes", {}))
+            print(f"{entry['timestamp']}  {entry['action']:<12} {entry['organization_name']}  {changed}")
@@ -0,0 +1,84 @@
+"""Micro-benchmark of PDF rendering cost per organization.
+
+Compares building the styles for every document (the old behavior, a new
+PdfRenderer per PDF) with the shared process-wide renderer, for single
+PDFs and one combined document. Records are synthetic and the PDF cache
+is bypassed.
+
+    python bench_pdf.py --sizes 1 100 1000
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from components.pdf_generator import PdfRenderer, get_renderer
+
+
+def sample_organizations(count: int) -> List[Dict[str, Any]]:
+    """Build organization records shaped like get_full_organization_data()."""
+    return [
+        {
+            "id": i,
+            "name_official": f"Research Institute {i}",
+            "name_short": f"RI{i}",
+            "type_primary": "research_institute",
+            "organization_scope": "national",
+            "founding_year": 1950 + i % 70,
+            "description_en": "An institute for applied research in history and philosophy. " * 4,
+            "email": f"info{i}@example.org",
+            "phone": "+34 600 000 000",
+            "street": f"Calle Mayor {i}",
+            "postal_code": "28001",
+            "city": "Madrid",
+            "country_name": "Spain",
+            "contact_name": "Ana Garcia",
+            "contact_position": "Director",
+            "url_original": f"https://example.org/{i}",
+            "twitter": "@institute",
+            "tags": {"disciplines": ["History", "Philosophy", "Archaeology"]},
+            "related": {"research_areas": ["Medieval history"], "partners": ["University of Madrid"]},
+        }
+        for i in range(count)
+    ]
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> float:
+    """Run fn repeat times and return the best elapsed seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(sizes: List[int], repeat: int = 3, country_code: str = "ES"):
+    """Print per-organization render time for each size and mode."""
+    get_renderer()  # build the shared renderer outside the timings
+    print(f"{'mode':<8}{'orgs':>6}{'per-document ms/org':>22}{'shared ms/org':>16}{'speedup':>9}")
+    for size in sizes:
+        organizations = sample_organizations(size)
+        results = {
+            "single": (
+                timed(lambda: [PdfRenderer().render(org, country_code) for org in organizations], repeat),
+                timed(lambda: [get_renderer().render(org, country_code) for org in organizations], repeat),
+            ),
+            "multi": (
+                timed(lambda: PdfRenderer().render_multi(organizations, country_code), repeat),
+                timed(lambda: get_renderer().render_multi(organizations, country_code), repeat),
+            ),
+        }
+        for mode, (before, after) in results.items():
+            print(
+                f"{mode:<8}{size:>6}{before / size * 1000:>22.2f}"
+                f"{after / size * 1000:>16.2f}{before / after:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark PDF rendering per organization.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 1000], help="Record counts to render")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+    bench(args.sizes, args.repeat)
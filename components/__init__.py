@@ -6,7 +6,7 @@ from .data_table import render_data_table
 from .expanded_row import render_expanded_row
 from .edit_dialog import render_edit_dialog
 from .floating_bar import render_floating_bar
-from .pdf_generator import generate_pdf, generate_multi_pdf
+from .pdf_generator import generate_pdf, generate_multi_pdf, generate_multi_pdf_parallel, generate_pdf_zip
 
 __all__ = [
     "render_header",
@@ -17,4 +17,6 @@ __all__ = [
     "render_floating_bar",
     "generate_pdf",
     "generate_multi_pdf",
+    "generate_multi_pdf_parallel",
+    "generate_pdf_zip",
 ]
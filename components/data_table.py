@@ -107,6 +107,12 @@ def render_data_table(
             st.rerun()
         return
 
+    # Relevance ranking is only meaningful while a search is active
+    if st.session_state.search_term:
+        relevance_cols = st.columns([5, 1])
+        with relevance_cols[1]:
+            render_sort_header("relevance", "Relevance", sort_column, sort_direction)
+
     # Table header
     header_cols = st.columns([0.5, 2.5, 1.5, 1, 2, 1.5, 1.5])
 
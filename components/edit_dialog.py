@@ -4,18 +4,12 @@ import streamlit as st
 from typing import Dict, Any, List
 import json
 
-from config import get_available_databases, ORGANIZATION_TYPES, ORGANIZATION_SCOPES
-from database import (
-    get_full_organization_data,
-    update_organization,
-    update_organization_tags,
-    update_organization_programs,
-    update_organization_research_areas,
-    update_organization_partners,
-    update_organization_events,
-)
+from config import ORGANIZATION_TYPES, ORGANIZATION_SCOPES
+from db_registry import get_available_databases
+from database import get_full_organization_data, save_organization
+from pdf_cache import pdf_cache
 from utils.session import set_editing_row
-from utils.logger import log_edit, calculate_changes
+from utils.logger import log_edit
 
 
 def parse_tags_input(text: str) -> List[str]:
@@ -274,39 +268,37 @@ def render_edit_dialog(org_id: int):
                 "geo_confidence": geo_confidence if geo_confidence else None,
             }
 
+            update_data["tags"] = {
+                "disciplines": parse_tags_input(disciplines_input),
+                "themes": parse_tags_input(themes_input),
+                "geographic": parse_tags_input(geographic_input),
+                "audience": parse_tags_input(audience_input),
+                "content_types": parse_tags_input(content_types_input),
+            }
+            update_data["related"] = {
+                "programs": parse_tags_input(programs_input),
+                "research_areas": parse_tags_input(research_areas_input),
+                "partners": parse_tags_input(partners_input),
+            }
+
+            # Parse events
+            try:
+                update_data["related"]["events"] = json.loads(events_input) if events_input else []
+            except json.JSONDecodeError:
+                st.warning("Invalid events JSON format. Events not updated.")
+
             try:
-                # Update main record
-                update_organization(db_path, org_id, update_data)
-
-                # Update tags
-                update_organization_tags(db_path, org_id, "disciplines", parse_tags_input(disciplines_input))
-                update_organization_tags(db_path, org_id, "themes", parse_tags_input(themes_input))
-                update_organization_tags(db_path, org_id, "geographic", parse_tags_input(geographic_input))
-                update_organization_tags(db_path, org_id, "audience", parse_tags_input(audience_input))
-                update_organization_tags(db_path, org_id, "content_types", parse_tags_input(content_types_input))
-
-                # Update related data
-                update_organization_programs(db_path, org_id, parse_tags_input(programs_input))
-                update_organization_research_areas(db_path, org_id, parse_tags_input(research_areas_input))
-                update_organization_partners(db_path, org_id, parse_tags_input(partners_input))
-
-                # Parse and update events
-                try:
-                    events_list = json.loads(events_input) if events_input else []
-                    update_organization_events(db_path, org_id, events_list)
-                except json.JSONDecodeError:
-                    st.warning("Invalid events JSON format. Events not updated.")
-
-                # Get updated data for logging
-                updated_org = get_full_organization_data(db_path, org_id)
-                changes = calculate_changes(org, updated_org)
+                # Write everything in one transaction and get the record it
+                # replaced with the diff, so the log matches what was stored
+                before, changes = save_organization(db_path, org_id, update_data)
+                pdf_cache.invalidate(country_code, [org_id])
 
                 # Log the edit
                 log_edit(
                     country_code=country_code,
                     record_id=org_id,
                     organization_name=org_name,
-                    full_record_before=org,
+                    full_record_before=before,
                     changes=changes,
                 )
 
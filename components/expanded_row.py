@@ -2,7 +2,7 @@
 
 import streamlit as st
 
-from config import get_available_databases
+from db_registry import get_available_databases
 from database import get_full_organization_data
 from utils.helpers import format_address, bool_to_yes_no
 
@@ -0,0 +1,80 @@
+"""PDF export progress and download component for Organizations Explorer."""
+
+import re
+
+import streamlit as st
+
+from config import PDF_EXPORT_POLL_INTERVAL
+from export_jobs import DONE, FAILED, CANCELLED, get_job, cancel_job, discard_job
+
+
+def _auto_refresh(func):
+    """Re-run func on its own every PDF_EXPORT_POLL_INTERVAL seconds where supported."""
+    fragment = getattr(st, "fragment", None)
+    if fragment is None:
+        return func
+    return fragment(run_every=PDF_EXPORT_POLL_INTERVAL)(func)
+
+
+def _deferred_downloads() -> bool:
+    """Check whether st.download_button accepts a callable that is only run on click (1.52+)."""
+    version = tuple(int(part) for part in re.findall(r"\d+", st.__version__)[:2])
+    return version >= (1, 52)
+
+
+def dismiss_export():
+    """Drop the session's export job and its result."""
+    discard_job(st.session_state.pdf_export_job)
+    st.session_state.pdf_export_job = None
+
+
+@_auto_refresh
+def render_export_progress():
+    """Render progress of the running export, polling until it finishes."""
+    job = get_job(st.session_state.pdf_export_job)
+    if job is None or job.finished:
+        # Show the result (or nothing) with a full rerun
+        st.rerun()
+        return
+
+    label = f"Preparing {job.output.upper()}: {job.done:,} of {job.total:,} organizations"
+    col1, col2 = st.columns([5, 1])
+    with col1:
+        st.progress(job.progress, text=label)
+    with col2:
+        if st.button("Cancel", key="cancel_export_btn", use_container_width=True):
+            cancel_job(job.id)
+    if not hasattr(st, "fragment"):
+        # No automatic polling on this Streamlit version
+        st.button("Refresh", key="refresh_export_btn")
+
+
+def render_export_status():
+    """Render the session's PDF export: progress, download button or error."""
+    job = get_job(st.session_state.pdf_export_job)
+    if job is None:
+        st.session_state.pdf_export_job = None
+        return
+
+    if not job.finished:
+        render_export_progress()
+        return
+
+    col1, col2 = st.columns([5, 1])
+    with col1:
+        if job.status == DONE:
+            st.download_button(
+                label=f"Download {job.output.upper()} ({job.total:,} organizations)",
+                # Read the file only when clicked, so reruns do not copy it
+                data=job.open_result if _deferred_downloads() else job.open_result(),
+                file_name=job.filename,
+                mime=job.mime,
+                type="primary",
+                key=f"download_export_{job.id}",
+            )
+        elif job.status == FAILED:
+            st.error(f"Export failed: {job.error}")
+        elif job.status == CANCELLED:
+            st.info("Export cancelled.")
+    with col2:
+        st.button("Dismiss", key="dismiss_export_btn", on_click=dismiss_export, use_container_width=True)
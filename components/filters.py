@@ -1,17 +1,46 @@
 """Filter bar component for Organizations Explorer."""
 
 import streamlit as st
-from typing import List
+from typing import Dict, List, Optional
 
+from config import FILTER_TAG_TYPES
 from utils.session import reset_filters
 
 
+def facet_options(options: List[str], counts: Optional[Dict[str, int]], selected: List[str]) -> List[str]:
+    """Keep options that still match rows (plus selected ones) when counts are known."""
+    if counts is None:
+        return options
+    return [option for option in options if counts.get(option) or option in selected]
+
+
+def facet_label(label: str, option: str, counts: Optional[Dict[str, int]]) -> str:
+    """Append the live match count to an option label."""
+    if counts is None:
+        return label
+    return f"{label} ({counts.get(option, 0):,})"
+
+
 def render_filters(
     types: List[str],
     disciplines: List[str],
     cities: List[str],
+    facet_counts: Optional[Dict[str, Dict[str, int]]] = None,
+    tag_options: Optional[Dict[str, List[str]]] = None,
 ):
-    """Render the filter bar with search, type, discipline, and city filters."""
+    """Render the filter bar with search, type, discipline, and city filters.
+
+    With facet_counts (from get_facet_counts), each option shows how many
+    rows it would match and options without matches are hidden.
+    tag_options (tag type -> values) adds theme, audience, region and
+    content type filters in a collapsible section.
+    """
+    facet_counts = facet_counts or {}
+    types = facet_options(types, facet_counts.get("types"), st.session_state.filter_types)
+    disciplines = facet_options(
+        disciplines, facet_counts.get("disciplines"), st.session_state.filter_disciplines
+    )
+    cities = facet_options(cities, facet_counts.get("cities"), st.session_state.filter_cities)
 
     # First row: Search and Type filter
     col1, col2, col3 = st.columns([2, 2, 2])
@@ -23,28 +52,29 @@ def render_filters(
             placeholder="Search organizations...",
             key="search_input",
         )
+        global_search = st.checkbox(
+            "Search all countries",
+            value=st.session_state.global_search,
+            key="global_search_input",
+        )
 
     with col2:
         # Format type options for display
-        type_options = [t.replace("_", " ").title() for t in types]
-        type_map = {t.replace("_", " ").title(): t for t in types}
-
-        selected_type_display = st.multiselect(
+        selected_types = st.multiselect(
             "Type",
-            options=type_options,
-            default=[t.replace("_", " ").title() for t in st.session_state.filter_types if t in types],
+            options=types,
+            default=[t for t in st.session_state.filter_types if t in types],
+            format_func=lambda t: facet_label(t.replace("_", " ").title(), t, facet_counts.get("types")),
             key="type_filter",
         )
 
     with col3:
         # Format discipline options for display
-        discipline_options = [d.replace("_", " ").title() for d in disciplines]
-        discipline_map = {d.replace("_", " ").title(): d for d in disciplines}
-
-        selected_discipline_display = st.multiselect(
+        selected_disciplines = st.multiselect(
             "Discipline",
-            options=discipline_options,
-            default=[d.replace("_", " ").title() for d in st.session_state.filter_disciplines if d in disciplines],
+            options=disciplines,
+            default=[d for d in st.session_state.filter_disciplines if d in disciplines],
+            format_func=lambda d: facet_label(d.replace("_", " ").title(), d, facet_counts.get("disciplines")),
             key="discipline_filter",
         )
 
@@ -56,6 +86,7 @@ def render_filters(
             "City",
             options=cities,
             default=[c for c in st.session_state.filter_cities if c in cities],
+            format_func=lambda c: facet_label(c, c, facet_counts.get("cities")),
             key="city_filter",
         )
 
@@ -67,12 +98,40 @@ def render_filters(
         st.markdown("<div style='margin-top: 28px;'></div>", unsafe_allow_html=True)
         clear_clicked = st.button("Clear All", use_container_width=True)
 
+    # Third row: other tag filters
+    selected_tags = {}
+    tag_match = st.session_state.tag_match
+    if tag_options:
+        active_tags = st.session_state.filter_tags
+        with st.expander("More Tags", expanded=any(active_tags.values())):
+            tag_cols = st.columns(len(tag_options))
+            for tag_col, (tag_type, options) in zip(tag_cols, tag_options.items()):
+                with tag_col:
+                    selected_tags[tag_type] = st.multiselect(
+                        FILTER_TAG_TYPES.get(tag_type, tag_type.replace("_", " ").title()),
+                        options=options,
+                        default=[v for v in active_tags.get(tag_type, []) if v in options],
+                        format_func=lambda v: v.replace("_", " ").title(),
+                        key=f"tag_filter_{tag_type}",
+                    )
+            tag_match = st.radio(
+                "Match tags",
+                options=["any", "all"],
+                index=0 if st.session_state.tag_match == "any" else 1,
+                format_func=lambda m: "Any selected value" if m == "any" else "All selected values",
+                horizontal=True,
+                key="tag_match_radio",
+            )
+
     # Handle apply
     if apply_clicked:
         st.session_state.search_term = search_term
-        st.session_state.filter_types = [type_map[t] for t in selected_type_display]
-        st.session_state.filter_disciplines = [discipline_map[d] for d in selected_discipline_display]
+        st.session_state.filter_types = selected_types
+        st.session_state.filter_disciplines = selected_disciplines
         st.session_state.filter_cities = selected_cities
+        st.session_state.filter_tags = {k: v for k, v in selected_tags.items() if v}
+        st.session_state.tag_match = tag_match
+        st.session_state.global_search = global_search
         st.session_state.current_page = 1
         st.rerun()
 
@@ -83,6 +142,8 @@ def render_filters(
 
     # Show active filters indicator
     active_filters = []
+    if st.session_state.global_search:
+        active_filters.append("All countries")
     if st.session_state.search_term:
         active_filters.append(f"Search: '{st.session_state.search_term}'")
     if st.session_state.filter_types:
@@ -91,6 +152,18 @@ def render_filters(
         active_filters.append(f"Disciplines: {len(st.session_state.filter_disciplines)}")
     if st.session_state.filter_cities:
         active_filters.append(f"Cities: {len(st.session_state.filter_cities)}")
+    for tag_type, values in st.session_state.filter_tags.items():
+        if values:
+            active_filters.append(f"{FILTER_TAG_TYPES.get(tag_type, tag_type)}: {len(values)}")
 
     if active_filters:
-        st.caption(f"Active filters: {', '.join(active_filters)}")
+        caption_col, delete_col = st.columns([5, 1])
+        with caption_col:
+            st.caption(f"Active filters: {', '.join(active_filters)}")
+        with delete_col:
+            # Bulk delete only applies to the selected country's database
+            if not st.session_state.global_search and st.button(
+                "Delete All Matching", key="delete_filtered_btn", use_container_width=True
+            ):
+                st.session_state.delete_filtered_confirm = True
+                st.rerun()
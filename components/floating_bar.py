@@ -1,7 +1,7 @@
 """Floating action bar component for Organizations Explorer."""
 
 import streamlit as st
-from typing import List, Callable
+from typing import List, Callable, Optional
 
 from utils.session import select_all_rows, deselect_all_rows, get_selected_count
 
@@ -10,6 +10,7 @@ def render_floating_bar(
     current_page_ids: List[int],
     on_download_selected: Callable[[], None],
     on_delete_selected: Callable[[], None],
+    on_download_zip: Optional[Callable[[], None]] = None,
 ):
     """Render the floating multi-select action bar."""
     selected_count = get_selected_count()
@@ -42,7 +43,7 @@ def render_floating_bar(
     )
 
     # Render the floating bar content
-    col1, col2, col3, col4, col5 = st.columns([1, 1, 1, 1, 1])
+    col1, col2, col3, col4, col5, col6 = st.columns([1, 1, 1, 1, 1, 1])
 
     with col1:
         if st.button("Select All (Page)", key="select_all_btn"):
@@ -62,6 +63,12 @@ def render_floating_bar(
             on_download_selected()
 
     with col5:
+        if on_download_zip is not None and st.button(
+            "ZIP", key="download_zip_btn", help="One PDF per organization in a ZIP archive"
+        ):
+            on_download_zip()
+
+    with col6:
         if st.button("Delete", key="delete_selected_btn"):
             on_delete_selected()
 
@@ -0,0 +1,162 @@
+"""Results table for search across all countries."""
+
+import streamlit as st
+from typing import List, Dict, Any
+
+from config import COUNTRIES
+from components.data_table import render_pagination, render_sort_header
+from utils.helpers import truncate_text, format_url
+
+
+def open_in_country(country_code: str, name: str):
+    """Leave global search and show the organization in its own country.
+
+    Runs as a button callback, before the widgets below are created again,
+    so the country selector and search box can be switched as well.
+    """
+    country = COUNTRIES[country_code]
+    st.session_state.country_selector = f"{country['flag']} {country['name']}"
+    st.session_state.search_input = name
+    st.session_state.global_search_input = False
+    st.session_state.global_search = False
+    st.session_state.selected_country = country_code
+    st.session_state.search_term = name
+    st.session_state.filter_types = []
+    st.session_state.filter_disciplines = []
+    st.session_state.filter_cities = []
+    st.session_state.filter_tags = {}
+    st.session_state.current_page = 1
+    st.session_state.selected_rows = set()
+    st.session_state.expanded_row = None
+
+
+def render_partial_results(
+    organizations: List[Dict[str, Any]],
+    finished: int,
+    total: int,
+    country_code: str,
+):
+    """Show the page merged so far while the remaining countries are searched.
+
+    Only plain elements are drawn (no widgets), so this can be redrawn in the
+    same placeholder after every country without duplicate widget keys.
+    """
+    st.progress(finished / total, text=f"Searched {finished} of {total} countries ({country_code})")
+    if organizations:
+        st.dataframe(
+            [
+                {
+                    "Country": org["country_code"],
+                    "Name": org.get("name_official") or org.get("name_short") or "-",
+                    "City": org.get("city") or "-",
+                    "Type": (org.get("type_primary") or "-").replace("_", " ").title(),
+                }
+                for org in organizations
+            ],
+            hide_index=True,
+            use_container_width=True,
+        )
+
+
+def render_global_results(
+    organizations: List[Dict[str, Any]],
+    total_count: int,
+    country_counts: Dict[str, int],
+    errors: Dict[str, str],
+):
+    """Render merged results from every country database."""
+    current_page = st.session_state.current_page
+    per_page = st.session_state.per_page
+    sort_column = st.session_state.sort_column
+    sort_direction = st.session_state.sort_direction
+
+    for country_code, error in sorted(errors.items()):
+        st.warning(f"{country_code}: search failed ({error})")
+
+    if not organizations:
+        st.info("No organizations found in any country matching your criteria.")
+        return
+
+    top_countries = sorted(country_counts.items(), key=lambda item: item[1], reverse=True)
+    st.caption(
+        f"Matches in {len(country_counts)} countries: "
+        + ", ".join(f"{code} ({count:,})" for code, count in top_countries[:10])
+        + (", ..." if len(top_countries) > 10 else "")
+    )
+
+    # Relevance ranking is only meaningful while a search is active
+    if st.session_state.search_term:
+        relevance_cols = st.columns([5, 1])
+        with relevance_cols[1]:
+            render_sort_header("relevance", "Relevance", sort_column, sort_direction)
+
+    # Table header
+    header_cols = st.columns([0.7, 2.5, 1.5, 1, 2.5, 1.5, 1])
+
+    with header_cols[0]:
+        st.button("Country", key="header_country", use_container_width=True, disabled=True)
+    with header_cols[1]:
+        render_sort_header("name_official", "Name", sort_column, sort_direction)
+    with header_cols[2]:
+        render_sort_header("city", "City", sort_column, sort_direction)
+    with header_cols[3]:
+        render_sort_header("type_primary", "Type", sort_column, sort_direction)
+    with header_cols[4]:
+        st.button("Description", key="header_desc", use_container_width=True, disabled=True)
+    with header_cols[5]:
+        st.button("Website-Email", key="header_website", use_container_width=True, disabled=True)
+    with header_cols[6]:
+        st.button("Actions", key="header_actions", use_container_width=True, disabled=True)
+
+    st.divider()
+
+    # Table rows
+    for org in organizations:
+        country_code = org["country_code"]
+        row_key = f"{country_code}_{org['id']}"
+        row_cols = st.columns([0.7, 2.5, 1.5, 1, 2.5, 1.5, 1])
+
+        with row_cols[0]:
+            st.markdown(f"**{country_code}**")
+
+        with row_cols[1]:
+            name = org.get("name_official") or org.get("name_short") or "-"
+            st.markdown(f"**{name}**")
+
+        with row_cols[2]:
+            city = org.get("city") or "-"
+            st.markdown(truncate_text(city, 25))
+
+        with row_cols[3]:
+            type_primary = org.get("type_primary") or "-"
+            st.markdown(type_primary.replace("_", " ").title()[:100])
+
+        with row_cols[4]:
+            description = org.get("description_en") or "-"
+            st.markdown(truncate_text(description, 250))
+
+        with row_cols[5]:
+            url = org.get("url_original")
+            email = org.get("email")
+            lines = []
+            if url:
+                display_url = format_url(url, 20)
+                lines.append(f"[{display_url}]({url})")
+            if email:
+                lines.append(email)
+            st.markdown("  \n  \n".join(lines) if lines else "-")
+
+        with row_cols[6]:
+            st.button(
+                "Open",
+                key=f"open_{row_key}",
+                help="Open in its country",
+                use_container_width=True,
+                on_click=open_in_country,
+                args=(country_code, org.get("name_official") or org.get("name_short") or ""),
+            )
+
+        st.divider()
+
+    # Pagination at bottom
+    render_pagination(total_count, current_page, per_page)
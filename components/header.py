@@ -3,7 +3,7 @@
 import streamlit as st
 from typing import Dict, Any
 
-from config import get_available_databases
+from db_registry import get_available_databases
 from utils.session import reset_all_state
 
 
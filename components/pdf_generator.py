@@ -1,14 +1,22 @@
 """PDF generation component for Organizations Explorer."""
 
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from io import BytesIO
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Optional, BinaryIO, Iterable, Iterator
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, cm
 from reportlab.platypus import (
+    Flowable,
     SimpleDocTemplate,
     Paragraph,
     Spacer,
@@ -17,7 +25,14 @@ from reportlab.platypus import (
     PageBreak,
 )
 
-from config import COUNTRIES
+from config import (
+    COUNTRIES,
+    PDF_RENDER_PROCESSES,
+    PDF_PARALLEL_MIN_ORGS,
+    PDF_CHUNK_SIZE,
+    PDF_SPOOL_MAX_BYTES,
+)
+from pdf_cache import pdf_cache
 
 
 def create_styles():
@@ -65,6 +80,40 @@ def create_styles():
     return styles
 
 
+class ProgressMarker(Flowable):
+    """Invisible flowable that reports progress when layout reaches it."""
+
+    def __init__(self, callback: Callable[[int, int], None], done: int, total: int):
+        super().__init__()
+        self.callback = callback
+        self.done = done
+        self.total = total
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def draw(self):
+        self.callback(self.done, self.total)
+
+
+class LazyStory(list):
+    """Story list filled from an iterator of flowable groups as the layout consumes it.
+
+    The document template takes flowables from the front of the list, so
+    only the group being laid out is held; flowables of finished pages are
+    released instead of the whole story existing up front.
+    """
+
+    def __init__(self, groups: Iterator[List[Flowable]]):
+        super().__init__()
+        self._groups = groups
+
+    def __len__(self):
+        if not list.__len__(self):
+            self.extend(next(self._groups, []))
+        return list.__len__(self)
+
+
 def safe_str(value) -> str:
     """Safely convert value to string."""
     if value is None:
@@ -72,67 +121,79 @@ def safe_str(value) -> str:
     return str(value)
 
 
-def generate_pdf(org: Dict[str, Any], country_code: str) -> BytesIO:
-    """Generate PDF for a single organization."""
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=1*cm,
-        leftMargin=1*cm,
-        topMargin=1*cm,
-        bottomMargin=1*cm,
-    )
-
-    styles = create_styles()
-    story = []
-
-    # Title
-    org_name = org.get('name_official') or org.get('name_short') or 'Unknown Organization'
-    story.append(Paragraph(org_name, styles['OrgTitle']))
-
-    # Short name if exists
-    if org.get('name_short') and org.get('name_official'):
-        story.append(Paragraph(f"Short Name: {org['name_short']}", styles['Label']))
-
-    story.append(Spacer(1, 12))
-
-    # Type, Scope, Founded line
-    type_str = safe_str(org.get('type_primary'))
-    scope_str = safe_str(org.get('organization_scope'))
-    founded_str = safe_str(org.get('founding_year'))
-    story.append(Paragraph(
-        f"Type: {type_str} | Scope: {scope_str} | Founded: {founded_str}",
-        styles['OrgBodyText']
-    ))
-
-    story.append(Spacer(1, 12))
-
-    # Description
-    story.append(Paragraph("DESCRIPTION", styles['SectionHeader']))
-    description = org.get('description_en') or "No description available."
-    story.append(Paragraph(description, styles['OrgBodyText']))
-
-    story.append(Spacer(1, 12))
-
-    # Contact and Key Person (two columns)
-    contact_data = [
-        ["CONTACT", "KEY PERSON"],
-        [
-            f"Email: {safe_str(org.get('email'))}",
-            f"Name: {safe_str(org.get('contact_name'))}"
-        ],
-        [
-            f"Phone: {safe_str(org.get('phone'))}",
-            f"Position: {safe_str(org.get('contact_position'))}"
-        ],
-        [
-            f"Fax: {safe_str(org.get('fax'))}",
-            f"Email: {safe_str(org.get('contact_email'))}"
-        ],
-    ]
-
-    # Build address
+def generate_pdf(org: Dict[str, Any], country_code: str, use_cache: bool = True) -> BytesIO:
+    """Generate PDF for a single organization, served from the PDF cache when unchanged."""
+    data = pdf_cache.get("single", country_code, [org]) if use_cache else None
+    if data is None:
+        data = _render_pdf(org, country_code).getvalue()
+        if use_cache:
+            pdf_cache.put("single", country_code, [org], data)
+    return BytesIO(data)
+
+
+def _render_pdf(org: Dict[str, Any], country_code: str) -> BytesIO:
+    """Render the PDF for a single organization."""
+    return get_renderer().render(org, country_code)
+
+
+def generate_multi_pdf(
+    organizations: List[Dict[str, Any]],
+    country_code: str,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    use_cache: bool = True,
+) -> BytesIO:
+    """Generate PDF for multiple organizations with page breaks.
+
+    on_progress(done, total) is called while the document is laid out, once
+    each organization is on the page; an exception raised from it aborts
+    the build. A cached document for the same data is returned directly.
+    """
+    data = pdf_cache.get("multi", country_code, organizations) if use_cache else None
+    if data is None:
+        data = _render_multi_pdf(organizations, country_code, on_progress).getvalue()
+        if use_cache:
+            pdf_cache.put("multi", country_code, organizations, data)
+    elif on_progress is not None:
+        on_progress(len(organizations), len(organizations))
+    return BytesIO(data)
+
+
+def stream_multi_pdf(
+    organizations: Iterable[Dict[str, Any]],
+    country_code: str,
+    total: int,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> BinaryIO:
+    """Render a multi-organization PDF into a spooled temporary file.
+
+    organizations can be a generator over the database (see
+    iter_full_organizations_data), so neither the records nor the story of
+    a very large export are held in memory at once. The file stays in
+    memory up to PDF_SPOOL_MAX_BYTES and moves to disk beyond that; the
+    caller owns it and should close it. Streamed documents bypass the PDF
+    cache.
+    """
+    output = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_BYTES)
+    try:
+        get_renderer().write_multi(output, organizations, country_code, total, on_progress)
+    except BaseException:
+        output.close()
+        raise
+    output.seek(0)
+    return output
+
+
+def _render_multi_pdf(
+    organizations: List[Dict[str, Any]],
+    country_code: str,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> BytesIO:
+    """Render the PDF for multiple organizations with page breaks."""
+    return get_renderer().render_multi(organizations, country_code, on_progress)
+
+
+def format_address(org: Dict[str, Any]) -> str:
+    """Join the address fields of an organization into one line."""
     address_parts = []
     if org.get('street'):
         address_parts.append(org['street'])
@@ -145,118 +206,55 @@ def generate_pdf(org: Dict[str, Any], country_code: str) -> BytesIO:
         address_parts.append(' '.join(city_parts))
     if org.get('country_name'):
         address_parts.append(org['country_name'])
-    address = ', '.join(address_parts) if address_parts else '-'
-
-    contact_data.append([f"Address: {address}", f"Phone: {safe_str(org.get('contact_phone'))}"])
-
-    contact_table = Table(contact_data, colWidths=[9*cm, 9*cm])
-    contact_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1E88E5')),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    story.append(contact_table)
-
-    story.append(Spacer(1, 12))
-
-    # Disciplines and Research Areas
-    tags = org.get('tags', {})
-    related = org.get('related', {})
-
-    disciplines = tags.get('disciplines', [])
-    research_areas = related.get('research_areas', [])
-
-    disciplines_str = '\n'.join([f"- {d}" for d in disciplines]) if disciplines else "-"
-    research_str = '\n'.join([f"- {r}" for r in research_areas]) if research_areas else "-"
-
-    academic_data = [
-        ["DISCIPLINES", "RESEARCH AREAS"],
-        [disciplines_str, research_str],
-    ]
-
-    academic_table = Table(academic_data, colWidths=[9*cm, 9*cm])
-    academic_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1E88E5')),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    story.append(academic_table)
-
-    story.append(Spacer(1, 12))
-
-    # Partners and Social Media
-    partners = related.get('partners', [])
-    partners_str = '\n'.join([f"- {p}" for p in partners]) if partners else "-"
-
-    social_lines = []
-    if org.get('twitter'):
-        social_lines.append(f"Twitter: {org['twitter']}")
-    if org.get('linkedin'):
-        social_lines.append(f"LinkedIn: {org['linkedin']}")
-    if org.get('facebook'):
-        social_lines.append(f"Facebook: {org['facebook']}")
-    if org.get('youtube'):
-        social_lines.append(f"YouTube: {org['youtube']}")
-    social_str = '\n'.join(social_lines) if social_lines else "-"
-
-    network_data = [
-        ["PARTNERS", "SOCIAL MEDIA"],
-        [partners_str, social_str],
-    ]
-
-    network_table = Table(network_data, colWidths=[9*cm, 9*cm])
-    network_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1E88E5')),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-    story.append(network_table)
-
-    story.append(Spacer(1, 12))
-
-    # Website
-    story.append(Paragraph("WEBSITE", styles['SectionHeader']))
-    url = org.get('url_original') or '-'
-    story.append(Paragraph(url, styles['OrgBodyText']))
-
-    story.append(Spacer(1, 24))
-
-    # Footer
-    country_name = COUNTRIES.get(country_code, {}).get('name', country_code)
-    generated_date = datetime.now().strftime("%Y-%m-%d %H:%M")
-    footer_text = f"ID: {org.get('id', '-')} | Acquired from {country_code} - {country_name} database | Generated: {generated_date}"
-    story.append(Paragraph(footer_text, styles['OrgFooter']))
-
-    doc.build(story)
-    buffer.seek(0)
-    return buffer
+    return ', '.join(address_parts) if address_parts else '-'
+
+
+def bullet_list(values: List[str]) -> str:
+    """Format values as a "- value" list for a table cell."""
+    return '\n'.join([f"- {v}" for v in values]) if values else "-"
+
+
+class PdfRenderer:
+    """Renders organization PDFs with styles built once and shared by every document.
+
+    Paragraph styles and the two-column table style are only read during
+    layout, so one renderer per process serves all documents and threads.
+    """
+
+    def __init__(self):
+        self.styles = create_styles()
+        self.table_style = TableStyle([
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1E88E5')),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ])
+        self.column_widths = [9*cm, 9*cm]
+
+    def new_document(self, buffer) -> SimpleDocTemplate:
+        """Create an A4 document writing to buffer."""
+        return SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            rightMargin=1*cm,
+            leftMargin=1*cm,
+            topMargin=1*cm,
+            bottomMargin=1*cm,
+        )
+
+    def table(self, data: List[List[str]]) -> Table:
+        """Two-column table with a highlighted header row."""
+        table = Table(data, colWidths=self.column_widths)
+        table.setStyle(self.table_style)
+        return table
+
+    def header_story(self, org: Dict[str, Any]) -> List[Flowable]:
+        """Title, short name, type line and description shared by both layouts."""
+        styles = self.styles
+        story = []
 
-
-def generate_multi_pdf(organizations: List[Dict[str, Any]], country_code: str) -> BytesIO:
-    """Generate PDF for multiple organizations with page breaks."""
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=1*cm,
-        leftMargin=1*cm,
-        topMargin=1*cm,
-        bottomMargin=1*cm,
-    )
-
-    styles = create_styles()
-    story = []
-
-    for i, org in enumerate(organizations):
         # Title
         org_name = org.get('name_official') or org.get('name_short') or 'Unknown Organization'
         story.append(Paragraph(org_name, styles['OrgTitle']))
@@ -284,29 +282,12 @@ def generate_multi_pdf(organizations: List[Dict[str, Any]], country_code: str) -
         story.append(Paragraph(description, styles['OrgBodyText']))
 
         story.append(Spacer(1, 12))
+        return story
 
-        # Contact info
-        story.append(Paragraph("CONTACT", styles['SectionHeader']))
-        story.append(Paragraph(f"Email: {safe_str(org.get('email'))}", styles['OrgBodyText']))
-        story.append(Paragraph(f"Phone: {safe_str(org.get('phone'))}", styles['OrgBodyText']))
-
-        # Build address
-        address_parts = []
-        if org.get('street'):
-            address_parts.append(org['street'])
-        city_parts = []
-        if org.get('postal_code'):
-            city_parts.append(org['postal_code'])
-        if org.get('city'):
-            city_parts.append(org['city'])
-        if city_parts:
-            address_parts.append(' '.join(city_parts))
-        if org.get('country_name'):
-            address_parts.append(org['country_name'])
-        address = ', '.join(address_parts) if address_parts else '-'
-        story.append(Paragraph(f"Address: {address}", styles['OrgBodyText']))
-
-        story.append(Spacer(1, 12))
+    def footer_story(self, org: Dict[str, Any], country_code: str, generated_date: str) -> List[Flowable]:
+        """Website section and source footer shared by both layouts."""
+        styles = self.styles
+        story = []
 
         # Website
         story.append(Paragraph("WEBSITE", styles['SectionHeader']))
@@ -317,14 +298,316 @@ def generate_multi_pdf(organizations: List[Dict[str, Any]], country_code: str) -
 
         # Footer
         country_name = COUNTRIES.get(country_code, {}).get('name', country_code)
-        generated_date = datetime.now().strftime("%Y-%m-%d %H:%M")
         footer_text = f"ID: {org.get('id', '-')} | Acquired from {country_code} - {country_name} database | Generated: {generated_date}"
         story.append(Paragraph(footer_text, styles['OrgFooter']))
+        return story
+
+    def organization_story(self, org: Dict[str, Any], country_code: str, generated_date: str) -> List[Flowable]:
+        """Full single-organization layout with contact, academic and network tables."""
+        story = self.header_story(org)
+
+        # Contact and Key Person (two columns)
+        contact_data = [
+            ["CONTACT", "KEY PERSON"],
+            [
+                f"Email: {safe_str(org.get('email'))}",
+                f"Name: {safe_str(org.get('contact_name'))}"
+            ],
+            [
+                f"Phone: {safe_str(org.get('phone'))}",
+                f"Position: {safe_str(org.get('contact_position'))}"
+            ],
+            [
+                f"Fax: {safe_str(org.get('fax'))}",
+                f"Email: {safe_str(org.get('contact_email'))}"
+            ],
+            [f"Address: {format_address(org)}", f"Phone: {safe_str(org.get('contact_phone'))}"],
+        ]
+        story.append(self.table(contact_data))
+
+        story.append(Spacer(1, 12))
 
-        # Page break between organizations (except for the last one)
-        if i < len(organizations) - 1:
-            story.append(PageBreak())
+        # Disciplines and Research Areas
+        tags = org.get('tags', {})
+        related = org.get('related', {})
+        story.append(self.table([
+            ["DISCIPLINES", "RESEARCH AREAS"],
+            [bullet_list(tags.get('disciplines', [])), bullet_list(related.get('research_areas', []))],
+        ]))
 
-    doc.build(story)
+        story.append(Spacer(1, 12))
+
+        # Partners and Social Media
+        social_lines = []
+        if org.get('twitter'):
+            social_lines.append(f"Twitter: {org['twitter']}")
+        if org.get('linkedin'):
+            social_lines.append(f"LinkedIn: {org['linkedin']}")
+        if org.get('facebook'):
+            social_lines.append(f"Facebook: {org['facebook']}")
+        if org.get('youtube'):
+            social_lines.append(f"YouTube: {org['youtube']}")
+        social_str = '\n'.join(social_lines) if social_lines else "-"
+
+        story.append(self.table([
+            ["PARTNERS", "SOCIAL MEDIA"],
+            [bullet_list(related.get('partners', [])), social_str],
+        ]))
+
+        story.append(Spacer(1, 12))
+        story.extend(self.footer_story(org, country_code, generated_date))
+        return story
+
+    def section_story(self, org: Dict[str, Any], country_code: str, generated_date: str) -> List[Flowable]:
+        """Compact layout used for each organization of a multi-organization export."""
+        styles = self.styles
+        story = self.header_story(org)
+
+        # Contact info
+        story.append(Paragraph("CONTACT", styles['SectionHeader']))
+        story.append(Paragraph(f"Email: {safe_str(org.get('email'))}", styles['OrgBodyText']))
+        story.append(Paragraph(f"Phone: {safe_str(org.get('phone'))}", styles['OrgBodyText']))
+        story.append(Paragraph(f"Address: {format_address(org)}", styles['OrgBodyText']))
+
+        story.append(Spacer(1, 12))
+        story.extend(self.footer_story(org, country_code, generated_date))
+        return story
+
+    def render(self, org: Dict[str, Any], country_code: str) -> BytesIO:
+        """Render the PDF for a single organization."""
+        buffer = BytesIO()
+        generated_date = datetime.now().strftime("%Y-%m-%d %H:%M")
+        self.new_document(buffer).build(self.organization_story(org, country_code, generated_date))
+        buffer.seek(0)
+        return buffer
+
+    def iter_sections(
+        self,
+        organizations: Iterable[Dict[str, Any]],
+        country_code: str,
+        total: int,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Iterator[List[Flowable]]:
+        """Yield the flowables of each organization, separated by page breaks."""
+        generated_date = datetime.now().strftime("%Y-%m-%d %H:%M")
+        for i, org in enumerate(organizations):
+            section = []
+
+            # Page break between organizations (none before the first one)
+            if i > 0:
+                section.append(PageBreak())
+
+            section.extend(self.section_story(org, country_code, generated_date))
+
+            if on_progress is not None:
+                section.append(ProgressMarker(on_progress, i + 1, total))
+
+            yield section
+
+    def write_multi(
+        self,
+        output: BinaryIO,
+        organizations: Iterable[Dict[str, Any]],
+        country_code: str,
+        total: int,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ):
+        """Write the PDF for multiple organizations, one per page, to output.
+
+        organizations may be a generator; each record is turned into
+        flowables only when the layout reaches it.
+        """
+        story = LazyStory(self.iter_sections(organizations, country_code, total, on_progress))
+        self.new_document(output).build(story)
+
+    def render_multi(
+        self,
+        organizations: List[Dict[str, Any]],
+        country_code: str,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> BytesIO:
+        """Render the PDF for multiple organizations, one per page."""
+        buffer = BytesIO()
+        self.write_multi(buffer, organizations, country_code, len(organizations), on_progress)
+        buffer.seek(0)
+        return buffer
+
+
+_renderer: Optional[PdfRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_renderer() -> PdfRenderer:
+    """Get the process-wide renderer, building its styles on first use."""
+    global _renderer
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None:
+                _renderer = PdfRenderer()
+    return _renderer
+
+
+_render_pool: Optional[ProcessPoolExecutor] = None
+_render_pool_lock = threading.Lock()
+
+
+def render_workers() -> int:
+    """Number of render worker processes."""
+    return PDF_RENDER_PROCESSES or os.cpu_count() or 1
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """Get the process pool used for parallel rendering, starting it on first use.
+
+    Workers are spawned rather than forked so they do not inherit the
+    app's threads, locks and open database connections.
+    """
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(
+                max_workers=render_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _render_pool
+
+
+def split_chunks(organizations: List[Dict[str, Any]], workers: int) -> List[List[Dict[str, Any]]]:
+    """Split organizations into ordered chunks, about two per worker for load balancing."""
+    size = max(PDF_CHUNK_SIZE, -(-len(organizations) // (workers * 2)))
+    return [organizations[start:start + size] for start in range(0, len(organizations), size)]
+
+
+def _render_chunk(organizations: List[Dict[str, Any]], country_code: str) -> bytes:
+    """Worker: render one chunk as a multi-organization PDF."""
+    return _render_multi_pdf(organizations, country_code).getvalue()
+
+
+def _render_single_chunk(organizations: List[Dict[str, Any]], country_code: str) -> List[bytes]:
+    """Worker: render each organization of a chunk as its own PDF."""
+    return [_render_pdf(org, country_code).getvalue() for org in organizations]
+
+
+def pdf_filename(org: Dict[str, Any]) -> str:
+    """File name for an organization's PDF inside an export archive."""
+    name = org.get('name_official') or org.get('name_short') or 'organization'
+    safe_name = re.sub(r'[^\w.-]+', '_', name).strip('_')[:80]
+    return f"{org.get('id', 0)}_{safe_name}.pdf"
+
+
+def _run_chunks(
+    worker: Callable,
+    organizations: List[Dict[str, Any]],
+    country_code: str,
+    on_progress: Optional[Callable[[int, int], None]],
+) -> List[Any]:
+    """Run worker over chunks in the render pool and return results in chunk order.
+
+    on_progress(done, total) is called as chunks finish; an exception
+    raised from it cancels the chunks that have not started yet.
+    """
+    pool = get_render_pool()
+    chunks = split_chunks(organizations, render_workers())
+    futures = {
+        pool.submit(worker, chunk, country_code): index for index, chunk in enumerate(chunks)
+    }
+    results = [None] * len(chunks)
+    done = 0
+    try:
+        for future in as_completed(futures):
+            index = futures[future]
+            results[index] = future.result()
+            done += len(chunks[index])
+            if on_progress is not None:
+                on_progress(done, len(organizations))
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    return results
+
+
+def generate_multi_pdf_parallel(
+    organizations: List[Dict[str, Any]],
+    country_code: str,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> BytesIO:
+    """Generate the same document as generate_multi_pdf() on several processes.
+
+    Organizations are split into ordered chunks, each chunk is rendered by
+    a worker process, and the chunk PDFs are concatenated in order. Every
+    organization starts on a new page either way, so the result matches a
+    single-process render. Small exports, single-CPU machines and installs
+    without pypdf render in this process. Both paths use the PDF cache.
+    """
+    try:
+        from pypdf import PdfWriter
+    except ImportError:
+        PdfWriter = None
+
+    if PdfWriter is None or len(organizations) < PDF_PARALLEL_MIN_ORGS or render_workers() < 2:
+        return generate_multi_pdf(organizations, country_code, on_progress=on_progress)
+
+    cached = pdf_cache.get("multi", country_code, organizations)
+    if cached is not None:
+        if on_progress is not None:
+            on_progress(len(organizations), len(organizations))
+        return BytesIO(cached)
+
+    parts = _run_chunks(_render_chunk, organizations, country_code, on_progress)
+
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(BytesIO(part))
+    buffer = BytesIO()
+    writer.write(buffer)
+    pdf_cache.put("multi", country_code, organizations, buffer.getvalue())
+    buffer.seek(0)
+    return buffer
+
+
+def generate_pdf_zip(
+    organizations: List[Dict[str, Any]],
+    country_code: str,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> BytesIO:
+    """Generate a ZIP archive with one PDF per organization.
+
+    Cached PDFs are reused; the others are rendered in parallel for large
+    selections and added to the cache.
+    """
+    pdfs = [pdf_cache.get("single", country_code, [org]) for org in organizations]
+    missing = [org for org, data in zip(organizations, pdfs) if data is None]
+    done = len(organizations) - len(missing)
+
+    if len(missing) < PDF_PARALLEL_MIN_ORGS or render_workers() < 2:
+        rendered = []
+        for org in missing:
+            rendered.append(_render_pdf(org, country_code).getvalue())
+            done += 1
+            if on_progress is not None:
+                on_progress(done, len(organizations))
+    else:
+        def chunk_progress(chunk_done: int, _total: int):
+            on_progress(done + chunk_done, len(organizations))
+
+        chunks = _run_chunks(
+            _render_single_chunk, missing, country_code, chunk_progress if on_progress else None
+        )
+        rendered = [data for chunk in chunks for data in chunk]
+
+    rendered_iter = iter(rendered)
+    files = []
+    for org, data in zip(organizations, pdfs):
+        if data is None:
+            data = next(rendered_iter)
+            pdf_cache.put("single", country_code, [org], data)
+        files.append((pdf_filename(org), data))
+
+    buffer = BytesIO()
+    # PDFs are already compressed
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        for filename, data in files:
+            archive.writestr(filename, data)
     buffer.seek(0)
     return buffer
@@ -158,28 +158,101 @@ DB_FOLDER = Path(__file__).parent / "db"
 
 # Logs folder
 LOGS_FOLDER = Path(__file__).parent / "logs"
+AUDIT_DB_PATH = LOGS_FOLDER / "audit.db"  # Append-only journal of edits and deletes
+AUDIT_ASYNC = True  # Write audit entries on a background thread
+AUDIT_SNAPSHOT_INTERVAL = 20  # Edits per full-record snapshot; others log only changes (None = always full)
+AUDIT_QUEUE_SIZE = 10000  # Entries waiting for the writer before callers are held back
+AUDIT_BATCH_SIZE = 500  # Entries written per transaction
+AUDIT_FLUSH_INTERVAL = 0.5  # Seconds a partial batch waits for more entries
+AUDIT_ENQUEUE_TIMEOUT = 5.0  # Seconds a caller waits on a full queue before the entry is dropped
+
+# Read-only replica merging every country database (built by replica.py)
+GLOBAL_DB_PATH = Path(__file__).parent / "global.db"
+USE_GLOBAL_REPLICA = True  # Serve all-country search from the replica when it exists
+
+# SQLite connection pool settings
+DB_POOL_SIZE = 8  # Idle connections kept open per database file
+DB_BUSY_TIMEOUT = 5.0  # Seconds a connection waits on a locked database
+SQLITE_JOURNAL_MODE = "WAL"  # Readers never block behind the writer
+SQLITE_PRAGMAS = {
+    "synchronous": "NORMAL",  # Safe with WAL, one fsync per checkpoint
+    "cache_size": -16000,  # ~16 MB page cache per connection
+    "mmap_size": 268435456,  # 256 MB memory-mapped I/O
+    "temp_store": "MEMORY",
+}
+
+# Database discovery
+DB_REGISTRY_STAT_INTERVAL = 30  # Seconds between re-reading file size, mtime and row count
+
+# Background PDF exports
+PDF_EXPORT_WORKERS = 2  # Exports rendered at the same time
+PDF_EXPORT_JOB_TTL = 3600  # Seconds a finished export is kept for download
+PDF_EXPORT_POLL_INTERVAL = 1.0  # Seconds between progress updates in the UI
+PDF_RENDER_PROCESSES = None  # Render worker processes (None = one per CPU)
+PDF_PARALLEL_MIN_ORGS = 50  # Smaller exports render in-process
+PDF_CHUNK_SIZE = 25  # Minimum organizations per worker task
+PDF_STREAM_MIN_ORGS = 500  # Larger PDF exports stream into a temporary file
+PDF_SPOOL_MAX_BYTES = 8 * 1024 * 1024  # Export output kept in memory up to this size, then on disk
+
+# Rendered PDF cache (keyed on a hash of the organization data)
+PDF_CACHE_ENABLED = True
+PDF_CACHE_FOLDER = Path(__file__).parent / "cache" / "pdf"
+PDF_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Process-wide read query cache
+QUERY_CACHE_ENABLED = True
+QUERY_CACHE_MAX_ENTRIES = 2048
+QUERY_CACHE_TTL = 300  # Seconds before an entry is re-read even without writes
+
+# Columns the data table can be sorted by
+SORTABLE_COLUMNS = [
+    "name_official",
+    "name_short",
+    "city",
+    "country_name",
+    "type_primary",
+    "description_en",
+    "url_original",
+]
+
+# Columns covered by the full-text search index
+SEARCH_COLUMNS = [
+    "name_official",
+    "name_short",
+    "name_local",
+    "description_en",
+    "description_local",
+    "email",
+    "url_original",
+    "contact_name",
+]
+
+# Tag dimensions filtered through the in-memory tag index, besides disciplines
+FILTER_TAG_TYPES = {
+    "themes": "Theme",
+    "audience": "Audience",
+    "geographic": "Region",
+    "content_types": "Content Type",
+}
 
 # Pagination options
 PER_PAGE_OPTIONS = [10, 20, 50, 100]
 DEFAULT_PER_PAGE = 20
+KEYSET_PAGINATION = True  # Seek by (sort value, id) instead of OFFSET where possible
+
+# Search across all country databases
+FEDERATED_MAX_WORKERS = 8  # Databases queried in parallel
+
+
+def get_available_databases(db_folder=None, refresh=False):
+    """Get the available database files by country code.
 
+    Kept for existing imports; the catalog lives in db_registry, which is
+    imported here lazily because it reads its settings from this module.
+    """
+    from db_registry import get_available_databases as get_catalog
 
-def get_available_databases(db_folder=None):
-    """Scan db folder for available database files."""
-    if db_folder is None:
-        db_folder = DB_FOLDER
-    db_folder = Path(db_folder)
-
-    available = {}
-    if db_folder.exists():
-        for file in db_folder.glob("*.db"):
-            code = file.stem.upper()
-            if code in COUNTRIES:
-                available[code] = {
-                    **COUNTRIES[code],
-                    "path": str(file),
-                }
-    return available
+    return get_catalog(db_folder, refresh)
 
 
 def get_theme(dark_mode=False):
@@ -1,71 +1,335 @@
 """Database operations for Organizations Explorer."""
 
+import copy
+import functools
+import json
+import os
+import queue
+import re
 import sqlite3
+import tempfile
+import threading
+from concurrent.futures import Future
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from config import (
+    DB_BUSY_TIMEOUT,
+    DB_POOL_SIZE,
+    QUERY_CACHE_ENABLED,
+    SORTABLE_COLUMNS,
+    SQLITE_JOURNAL_MODE,
+    SQLITE_PRAGMAS,
+)
+from migrations import apply_migrations
+from query_cache import MISSING, freeze, query_cache
+from tag_index import TagIndex, bitmap_to_ids
+
+
+class DatabaseWriter:
+    """Single background thread that performs every write to one database.
+
+    Writes are queued and executed one at a time on a dedicated connection,
+    each inside its own BEGIN IMMEDIATE transaction, so concurrent editors
+    never race for the write lock and see no "database is locked" errors.
+    """
+
+    def __init__(self, pool: "ConnectionPool"):
+        self._pool = pool
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _ensure_started(self):
+        """Start the writer thread on first use."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"db-writer-{os.path.basename(self._pool.db_path)}",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self):
+        """Writer loop: execute queued writes until stopped."""
+        self._conn = self._pool._open()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                func, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = self._execute(func)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+        finally:
+            self._conn.close()
+            self._conn = None
+
+    def _execute(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run func in a write transaction on the writer connection."""
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = func(conn)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            # Invalidate cached reads even if the outcome is uncertain
+            self._pool.generation += 1
+        return result
+
+    def submit(self, func: Callable[[sqlite3.Connection], Any]) -> Future:
+        """Queue func(conn) for execution and return a future for its result."""
+        future: Future = Future()
+        self._ensure_started()
+        self._queue.put((func, future))
+        return future
+
+    def run(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Execute func(conn) on the writer thread and wait for its result."""
+        if threading.current_thread() is self._thread:
+            # Nested write from inside another write: already in its transaction
+            return func(self._conn)
+        return self.submit(func).result()
+
+    def stop(self):
+        """Finish queued writes and stop the writer thread."""
+        with self._lock:
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join()
+
+
+class ConnectionPool:
+    """Thread-safe pool of long-lived connections to a single database file.
+
+    Connections are opened lazily, configured once with SQLITE_PRAGMAS and
+    then handed out again on later calls, so Streamlit reruns and sessions
+    share warm connections instead of reconnecting on every query.
+    """
+
+    def __init__(self, db_path: str, max_size: int = DB_POOL_SIZE):
+        self.db_path = db_path
+        self.max_size = max_size
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.generation = 0  # Bumped after every write through the writer
+        self.writer = DatabaseWriter(self)
+
+    def _open(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(self.db_path, timeout=DB_BUSY_TIMEOUT, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma, value in SQLITE_PRAGMAS.items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Take an idle connection from the pool, opening one if none is free."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._open()
+
+    def release(self, conn: sqlite3.Connection):
+        """Return a connection to the pool, closing it if the pool is full."""
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            keep = not self._closed and self._idle.qsize() < self.max_size
+        if keep:
+            self._idle.put(conn)
+        else:
+            conn.close()
+
+    def initialize(self):
+        """Set the journal mode and migrate the schema (run once when the pool opens)."""
+        conn = self.acquire()
+        try:
+            conn.execute(f"PRAGMA journal_mode = {SQLITE_JOURNAL_MODE}")
+            apply_migrations(conn)
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """Stop the writer, close all idle connections and stop pooling new ones."""
+        self.writer.stop()
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+# Tag index per database file, with the data version it was built from
+_tag_indexes: Dict[str, Tuple[Any, TagIndex]] = {}
+_tag_indexes_lock = threading.Lock()
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    """Get the process-wide connection pool for a database file."""
+    key = os.path.abspath(db_path)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(key)
+                pool.initialize()
+                _pools[key] = pool
+    return pool
+
+
+def close_all_pools():
+    """Close every pooled connection (e.g. before replacing database files)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+    query_cache.clear()
+    _tag_indexes.clear()
 
 
 @contextmanager
 def get_connection(db_path: str):
-    """Context manager for database connections."""
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    """Context manager yielding a pooled connection for the database."""
+    pool = get_pool(db_path)
+    conn = pool.acquire()
     try:
         yield conn
     finally:
-        conn.close()
+        pool.release(conn)
+
+
+def get_data_version(db_path: str) -> Tuple[int, Tuple[int, ...]]:
+    """Get a value that changes whenever the database content may have changed.
+
+    Combines the in-process write generation with the size and mtime of the
+    database and WAL files, which also catches writes from other processes.
+    """
+    pool = get_pool(db_path)
+    signature = []
+    for path in (pool.db_path, pool.db_path + "-wal"):
+        try:
+            stat = os.stat(path)
+            signature.extend([stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            signature.extend([0, 0])
+    return pool.generation, tuple(signature)
+
+
+def cached_read(func):
+    """Cache a read function's result process-wide per database data version.
+
+    The wrapped function must take db_path as its first argument. Callers
+    get their own deep copy, so cached rows can't be mutated across sessions.
+    """
+    @functools.wraps(func)
+    def wrapper(db_path: str, *args, **kwargs):
+        if not QUERY_CACHE_ENABLED:
+            return func(db_path, *args, **kwargs)
+
+        key = (
+            os.path.abspath(db_path),
+            get_data_version(db_path),
+            func.__name__,
+            freeze(args),
+            freeze(kwargs),
+        )
+        result = query_cache.get(key)
+        if result is MISSING:
+            result = func(db_path, *args, **kwargs)
+            query_cache.set(key, result)
+        return copy.deepcopy(result)
+
+    return wrapper
+
+
+def run_write(db_path: str, func: Callable[[sqlite3.Connection], Any]) -> Any:
+    """Run func(conn) as one transaction on the database's writer thread.
 
+    func must not commit; the writer commits on success and rolls back if
+    func raises, re-raising the exception in the calling thread.
+    """
+    return get_pool(db_path).writer.run(func)
 
+
+@cached_read
 def get_total_records(db_path: str) -> int:
     """Get total number of records in the database."""
     with get_connection(db_path) as conn:
-        cursor = conn.execute("SELECT COUNT(*) FROM websites")
+        cursor = conn.execute("SELECT count FROM stats_totals WHERE name = 'websites'")
         return cursor.fetchone()[0]
 
 
-def get_statistics(db_path: str) -> Dict[str, List[Tuple[str, int, float]]]:
-    """Get statistics for the database."""
-    stats = {"cities": [], "types": [], "disciplines": []}
+# Statistics dimensions mapped to the total their percentages are based on
+STATISTICS_DIMENSIONS = {
+    "city": "websites",
+    "type_primary": "websites",
+    "discipline": "tag_disciplines",
+}
 
-    with get_connection(db_path) as conn:
-        # Top 5 cities
-        cursor = conn.execute("""
-            SELECT city, COUNT(*) as count,
-                   ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM websites), 1) as percentage
-            FROM websites
-            WHERE city IS NOT NULL AND city != ''
-            GROUP BY city
-            ORDER BY count DESC
-            LIMIT 5
-        """)
-        stats["cities"] = [(row["city"], row["count"], row["percentage"]) for row in cursor.fetchall()]
 
-        # Type distribution
-        cursor = conn.execute("""
-            SELECT type_primary, COUNT(*) as count,
-                   ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM websites), 1) as percentage
-            FROM websites
-            WHERE type_primary IS NOT NULL AND type_primary != ''
-            GROUP BY type_primary
-            ORDER BY count DESC
-            LIMIT 5
-        """)
-        stats["types"] = [(row["type_primary"], row["count"], row["percentage"]) for row in cursor.fetchall()]
+@cached_read
+def get_distribution(
+    db_path: str,
+    dimension: str,
+    limit: Optional[int] = None,
+) -> List[Tuple[str, int, float]]:
+    """Get (value, count, percentage) for a statistics dimension, most common first.
+
+    Reads the trigger-maintained stats tables, so the full distribution
+    (limit=None) costs the same as the top entries.
+    """
+    if dimension not in STATISTICS_DIMENSIONS:
+        raise ValueError(f"Unknown statistics dimension: {dimension}")
+
+    query = """
+        SELECT c.value, c.count,
+               ROUND(c.count * 100.0 / NULLIF(t.count, 0), 1) AS percentage
+        FROM stats_counts c
+        JOIN stats_totals t ON t.name = ?
+        WHERE c.dimension = ?
+        ORDER BY c.count DESC, c.value
+    """
+    params: List[Any] = [STATISTICS_DIMENSIONS[dimension], dimension]
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
 
-        # Top disciplines
-        cursor = conn.execute("""
-            SELECT discipline, COUNT(*) as count,
-                   ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM tag_disciplines), 1) as percentage
-            FROM tag_disciplines
-            GROUP BY discipline
-            ORDER BY count DESC
-            LIMIT 5
-        """)
-        stats["disciplines"] = [(row["discipline"], row["count"], row["percentage"]) for row in cursor.fetchall()]
+    with get_connection(db_path) as conn:
+        cursor = conn.execute(query, params)
+        return [(row["value"], row["count"], row["percentage"]) for row in cursor.fetchall()]
 
-    return stats
 
+def get_statistics(db_path: str, limit: Optional[int] = 5) -> Dict[str, List[Tuple[str, int, float]]]:
+    """Get statistics for the database (top `limit` entries, or all with None)."""
+    return {
+        "cities": get_distribution(db_path, "city", limit),
+        "types": get_distribution(db_path, "type_primary", limit),
+        "disciplines": get_distribution(db_path, "discipline", limit),
+    }
 
+
+@cached_read
 def get_distinct_types(db_path: str) -> List[str]:
     """Get distinct organization types."""
     with get_connection(db_path) as conn:
@@ -78,6 +342,7 @@ def get_distinct_types(db_path: str) -> List[str]:
         return [row["type_primary"] for row in cursor.fetchall()]
 
 
+@cached_read
 def get_distinct_disciplines(db_path: str) -> List[str]:
     """Get distinct disciplines."""
     with get_connection(db_path) as conn:
@@ -89,6 +354,12 @@ def get_distinct_disciplines(db_path: str) -> List[str]:
         return [row["discipline"] for row in cursor.fetchall()]
 
 
+def get_distinct_tags(db_path: str, tag_type: str) -> List[str]:
+    """Get distinct values of a tag dimension (any TAG_TABLES key) from the tag index."""
+    return get_tag_index(db_path).values(tag_type)
+
+
+@cached_read
 def get_distinct_cities(db_path: str) -> List[str]:
     """Get distinct cities."""
     with get_connection(db_path) as conn:
@@ -101,42 +372,48 @@ def get_distinct_cities(db_path: str) -> List[str]:
         return [row["city"] for row in cursor.fetchall()]
 
 
-def build_query(
+def build_match_query(search_term: str) -> Optional[str]:
+    """Turn free-text input into an FTS5 query matching every term as a prefix.
+
+    Each whitespace-separated term is quoted as one phrase, so "S.L." must
+    match the adjacent tokens "s l" rather than "s" and "l" anywhere.
+    Terms without any word character are dropped; returns None when none
+    are left.
+    """
+    terms = [term for term in search_term.split() if re.search(r"\w", term)]
+    if not terms:
+        return None
+    return " AND ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+
+def build_where(
     search_term: Optional[str] = None,
     filter_types: Optional[List[str]] = None,
     filter_disciplines: Optional[List[str]] = None,
     filter_cities: Optional[List[str]] = None,
-    sort_column: str = "name_official",
-    sort_direction: str = "asc",
-    limit: int = 20,
-    offset: int = 0,
-    count_only: bool = False,
-) -> Tuple[str, List[Any]]:
-    """Build SQL query with filters."""
-    params = []
+    filter_ids: Optional[List[int]] = None,
+) -> Tuple[str, str, List[Any], Optional[str]]:
+    """Build the FROM and WHERE clauses for the given filters.
 
-    if count_only:
-        select_clause = "SELECT COUNT(DISTINCT w.id)"
-    else:
-        select_clause = """
-            SELECT DISTINCT w.id, w.name_official, w.name_short, w.city, w.country_name,
-                   w.type_primary, w.description_en, w.url_original, w.email
-        """
+    filter_ids restricts the result to an id set resolved elsewhere (e.g.
+    from the tag index); it is bound as a single JSON parameter, so its size
+    is not limited by SQLite's variable limit.
 
+    Returns (from_clause, where_clause, params, match_query).
+    """
+    params = []
     from_clause = "FROM websites w"
     where_clauses = ["1=1"]
 
-    # Search term filter
-    if search_term:
-        search_fields = [
-            "w.name_official", "w.name_short", "w.name_local",
-            "w.description_en", "w.description_local", "w.email",
-            "w.url_original", "w.contact_name"
-        ]
-        search_conditions = " OR ".join([f"{field} LIKE ?" for field in search_fields])
-        where_clauses.append(f"({search_conditions})")
-        search_param = f"%{search_term}%"
-        params.extend([search_param] * len(search_fields))
+    # Search term filter (FTS5 prefix match)
+    match_query = build_match_query(search_term) if search_term else None
+    if match_query:
+        from_clause += " JOIN websites_fts ON websites_fts.rowid = w.id"
+        where_clauses.append("websites_fts MATCH ?")
+        params.append(match_query)
+    elif search_term and search_term.strip():
+        # Only punctuation was entered: nothing can match
+        where_clauses.append("0")
 
     # Type filter (OR within)
     if filter_types:
@@ -161,52 +438,199 @@ def build_query(
         """)
         params.extend(filter_disciplines)
 
-    where_clause = " AND ".join(where_clauses)
-    query = f"{select_clause} {from_clause} WHERE {where_clause}"
-
-    if not count_only:
-        # Add ordering
-        valid_columns = {
-            "name_official": "w.name_official",
-            "name_short": "w.name_short",
-            "city": "w.city",
-            "country_name": "w.country_name",
-            "type_primary": "w.type_primary",
-            "description_en": "w.description_en",
-            "url_original": "w.url_original",
-        }
-        order_column = valid_columns.get(sort_column, "w.name_official")
-        order_dir = "DESC" if sort_direction.lower() == "desc" else "ASC"
-        query += f" ORDER BY {order_column} {order_dir}"
+    # Pre-resolved id set
+    if filter_ids is not None:
+        where_clauses.append("w.id IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(filter_ids))
+
+    return from_clause, " AND ".join(where_clauses), params, match_query
+
+
+def get_tag_index(db_path: str) -> TagIndex:
+    """Get the in-memory tag index, rebuilding it after the database changed."""
+    key = os.path.abspath(db_path)
+    version = get_data_version(db_path)
+    entry = _tag_indexes.get(key)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    with _tag_indexes_lock:
+        entry = _tag_indexes.get(key)
+        if entry is None or entry[0] != version:
+            with get_connection(db_path) as conn:
+                entry = (version, TagIndex.build(conn, TAG_TABLES))
+            _tag_indexes[key] = entry
+    return entry[1]
+
+
+def resolve_tag_filter(
+    db_path: str,
+    filter_disciplines: Optional[List[str]] = None,
+    filter_tags: Optional[Dict[str, List[str]]] = None,
+    tag_match: str = "any",
+) -> Optional[List[int]]:
+    """Resolve discipline and other tag filters to matching ids via the tag index.
+
+    filter_tags maps TAG_TABLES keys (themes, audience, ...) to values.
+    Returns None when no tag filter is active.
+    """
+    tags = {key: values for key, values in (filter_tags or {}).items() if values}
+    if filter_disciplines:
+        tags["disciplines"] = filter_disciplines
+    if not tags:
+        return None
+    bitmap = get_tag_index(db_path).match(tags, match_all=tag_match == "all")
+    return bitmap_to_ids(bitmap)
+
 
-        # Add pagination
-        query += " LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
+def build_filtered_where(
+    db_path: str,
+    search_term: Optional[str] = None,
+    filter_types: Optional[List[str]] = None,
+    filter_disciplines: Optional[List[str]] = None,
+    filter_cities: Optional[List[str]] = None,
+    filter_tags: Optional[Dict[str, List[str]]] = None,
+    tag_match: str = "any",
+) -> Tuple[str, str, List[Any], Optional[str]]:
+    """build_where() with tag filters resolved through the tag index."""
+    return build_where(
+        search_term=search_term,
+        filter_types=filter_types,
+        filter_cities=filter_cities,
+        filter_ids=resolve_tag_filter(db_path, filter_disciplines, filter_tags, tag_match),
+    )
+
+
+def get_order_column(sort_column: str, match_query: Optional[str] = None) -> str:
+    """Map a sort column name to its SQL expression (name_official if unknown)."""
+    valid_columns = {column: f"w.{column}" for column in SORTABLE_COLUMNS}
+    if sort_column == "relevance" and match_query:
+        # FTS5 rank is bm25() by default, lower for better matches, so
+        # ascending = most relevant first.
+        valid_columns["relevance"] = "websites_fts.rank"
+    return valid_columns.get(sort_column, "w.name_official")
+
+
+def supports_keyset(sort_column: str) -> bool:
+    """Check whether keyset pagination can be used for a sort column."""
+    return sort_column in SORTABLE_COLUMNS
+
+
+def build_keyset_predicate(
+    order_column: str,
+    sort_direction: str,
+    page_cursor: Tuple[Any, int],
+    id_column: str = "w.id",
+) -> Tuple[str, List[Any]]:
+    """Build the WHERE predicate selecting rows after a (sort value, id) cursor.
+
+    SQLite sorts NULLs first in ascending order and last in descending order,
+    so NULL sort values need their own branch next to the row-value comparison.
+    """
+    value, last_id = page_cursor
+    if sort_direction.lower() == "desc":
+        if value is None:
+            return f"({order_column} IS NULL AND {id_column} < ?)", [last_id]
+        return f"(({order_column}, {id_column}) < (?, ?) OR {order_column} IS NULL)", [value, last_id]
+
+    if value is None:
+        return f"(({order_column} IS NULL AND {id_column} > ?) OR {order_column} IS NOT NULL)", [last_id]
+    return f"(({order_column}, {id_column}) > (?, ?))", [value, last_id]
+
+
+# Columns returned for each row of the organizations table
+LIST_COLUMNS = [
+    "id", "name_official", "name_short", "city", "country_name",
+    "type_primary", "description_en", "url_original", "email",
+]
+
+
+def build_query(
+    search_term: Optional[str] = None,
+    filter_types: Optional[List[str]] = None,
+    filter_disciplines: Optional[List[str]] = None,
+    filter_cities: Optional[List[str]] = None,
+    sort_column: str = "name_official",
+    sort_direction: str = "asc",
+    limit: int = 20,
+    offset: int = 0,
+    count_only: bool = False,
+    page_cursor: Optional[Tuple[Any, int]] = None,
+    filter_ids: Optional[List[int]] = None,
+    with_sort_value: bool = False,
+) -> Tuple[str, List[Any]]:
+    """Build SQL query with filters.
+
+    With page_cursor, rows are returned after that (sort value, id) key
+    (keyset pagination) and offset counts from the cursor instead of the
+    start of the result. With with_sort_value, every row also carries its
+    ORDER BY value as sort_value (for merging results from several databases).
+
+    The search join is 1:1 on rowid and the discipline and id filters are
+    subqueries, so no DISTINCT is needed.
+    """
+    from_clause, where_clause, params, match_query = build_where(
+        search_term=search_term,
+        filter_types=filter_types,
+        filter_disciplines=filter_disciplines,
+        filter_cities=filter_cities,
+        filter_ids=filter_ids,
+    )
+
+    if count_only:
+        return f"SELECT COUNT(*) {from_clause} WHERE {where_clause}", params
+
+    order_column = get_order_column(sort_column, match_query)
+    order_dir = "DESC" if sort_direction.lower() == "desc" else "ASC"
+    use_keyset = page_cursor is not None and supports_keyset(sort_column)
+    select_columns = ", ".join(f"w.{column}" for column in LIST_COLUMNS)
+    if with_sort_value:
+        select_columns += f", {order_column} AS sort_value"
+    if use_keyset:
+        predicate, predicate_params = build_keyset_predicate(order_column, sort_direction, page_cursor)
+        where_clause += f" AND {predicate}"
+        params.extend(predicate_params)
+
+    # Add ordering (id as tie-breaker keeps pages stable)
+    query = f"""
+        SELECT {select_columns} {from_clause}
+        WHERE {where_clause}
+        ORDER BY {order_column} {order_dir}, w.id {order_dir}
+    """
+
+    # Add pagination
+    query += " LIMIT ? OFFSET ?"
+    params.extend([limit, offset])
 
     return query, params
 
 
+@cached_read
 def get_organizations(
     db_path: str,
     search_term: Optional[str] = None,
     filter_types: Optional[List[str]] = None,
     filter_disciplines: Optional[List[str]] = None,
     filter_cities: Optional[List[str]] = None,
+    filter_tags: Optional[Dict[str, List[str]]] = None,
+    tag_match: str = "any",
     sort_column: str = "name_official",
     sort_direction: str = "asc",
     limit: int = 20,
     offset: int = 0,
+    page_cursor: Optional[Tuple[Any, int]] = None,
 ) -> List[Dict[str, Any]]:
     """Get paginated list of organizations with filters."""
     query, params = build_query(
         search_term=search_term,
         filter_types=filter_types,
-        filter_disciplines=filter_disciplines,
         filter_cities=filter_cities,
+        filter_ids=resolve_tag_filter(db_path, filter_disciplines, filter_tags, tag_match),
         sort_column=sort_column,
         sort_direction=sort_direction,
         limit=limit,
         offset=offset,
+        page_cursor=page_cursor,
     )
 
     with get_connection(db_path) as conn:
@@ -214,19 +638,180 @@ def get_organizations(
         return [dict(row) for row in cursor.fetchall()]
 
 
+@cached_read
+def get_organizations_page(
+    db_path: str,
+    search_term: Optional[str] = None,
+    filter_types: Optional[List[str]] = None,
+    filter_disciplines: Optional[List[str]] = None,
+    filter_cities: Optional[List[str]] = None,
+    filter_tags: Optional[Dict[str, List[str]]] = None,
+    tag_match: str = "any",
+    sort_column: str = "name_official",
+    sort_direction: str = "asc",
+    limit: int = 20,
+    offset: int = 0,
+    page_cursor: Optional[Tuple[Any, int]] = None,
+    with_sort_value: bool = False,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Get one page of organizations and the total filtered count.
+
+    The page is read by the indexed query (a keyset seek with page_cursor)
+    and the total by get_filtered_count(), cached per filter set, so paging
+    through a result counts it only once.
+    With with_sort_value, each row also carries its ORDER BY value as sort_value.
+
+    Returns (organizations, total_count).
+    """
+    filters = {
+        "search_term": search_term,
+        "filter_types": filter_types,
+        "filter_disciplines": filter_disciplines,
+        "filter_cities": filter_cities,
+        "filter_tags": filter_tags,
+        "tag_match": tag_match,
+    }
+    query, params = build_query(
+        search_term=search_term,
+        filter_types=filter_types,
+        filter_cities=filter_cities,
+        filter_ids=resolve_tag_filter(db_path, filter_disciplines, filter_tags, tag_match),
+        sort_column=sort_column,
+        sort_direction=sort_direction,
+        limit=limit,
+        offset=offset,
+        page_cursor=page_cursor,
+        with_sort_value=with_sort_value,
+    )
+
+    with get_connection(db_path) as conn:
+        rows = [dict(row) for row in conn.execute(query, params).fetchall()]
+    return rows, get_filtered_count(db_path, **filters)
+
+
+@cached_read
+def get_facet_counts(
+    db_path: str,
+    search_term: Optional[str] = None,
+    filter_types: Optional[List[str]] = None,
+    filter_disciplines: Optional[List[str]] = None,
+    filter_cities: Optional[List[str]] = None,
+    filter_tags: Optional[Dict[str, List[str]]] = None,
+    tag_match: str = "any",
+) -> Dict[str, Dict[str, int]]:
+    """Count matches for every type, discipline and city option under the current filters.
+
+    Each dimension is counted with all other filters applied but not its
+    own, so already-selected values still show how many rows the
+    alternatives would add. Rows matching the search are read once,
+    with their disciplines, and all three facets are counted from that scan.
+    """
+    # Non-discipline tag filters narrow every facet, so apply them in SQL
+    from_clause, where_clause, params, _ = build_where(
+        search_term=search_term,
+        filter_ids=resolve_tag_filter(db_path, None, filter_tags, tag_match),
+    )
+    query = f"""
+        SELECT w.id, w.type_primary, w.city, GROUP_CONCAT(d.discipline, char(31)) AS disciplines
+        {from_clause}
+        LEFT JOIN tag_disciplines d ON d.website_id = w.id
+        WHERE {where_clause}
+        GROUP BY w.id
+    """
+
+    types = set(filter_types or [])
+    cities = set(filter_cities or [])
+    disciplines = set(filter_disciplines or [])
+    facets = {"types": {}, "disciplines": {}, "cities": {}}
+
+    with get_connection(db_path) as conn:
+        for row in conn.execute(query, params):
+            type_primary = row["type_primary"]
+            city = row["city"]
+            row_disciplines = row["disciplines"].split("\x1f") if row["disciplines"] else []
+
+            type_ok = not types or type_primary in types
+            city_ok = not cities or city in cities
+            if tag_match == "all":
+                discipline_ok = disciplines.issubset(row_disciplines)
+            else:
+                discipline_ok = not disciplines or not disciplines.isdisjoint(row_disciplines)
+
+            if type_primary and city_ok and discipline_ok:
+                facets["types"][type_primary] = facets["types"].get(type_primary, 0) + 1
+            if city and type_ok and discipline_ok:
+                facets["cities"][city] = facets["cities"].get(city, 0) + 1
+            if type_ok and city_ok:
+                for discipline in row_disciplines:
+                    facets["disciplines"][discipline] = facets["disciplines"].get(discipline, 0) + 1
+
+    return facets
+
+
+@cached_read
+def get_page_anchors(
+    db_path: str,
+    search_term: Optional[str] = None,
+    filter_types: Optional[List[str]] = None,
+    filter_disciplines: Optional[List[str]] = None,
+    filter_cities: Optional[List[str]] = None,
+    filter_tags: Optional[Dict[str, List[str]]] = None,
+    tag_match: str = "any",
+    sort_column: str = "name_official",
+    sort_direction: str = "asc",
+    per_page: int = 20,
+) -> List[Optional[Tuple[Any, int]]]:
+    """Get the keyset cursor that starts every page of a result.
+
+    anchors[0] is None (first page); anchors[n] is the (sort value, id) of the
+    last row on page n. Only the sort key is read, so this is one index-only
+    pass instead of materializing every row before the requested page.
+    """
+    from_clause, where_clause, params, match_query = build_filtered_where(
+        db_path,
+        search_term=search_term,
+        filter_types=filter_types,
+        filter_disciplines=filter_disciplines,
+        filter_cities=filter_cities,
+        filter_tags=filter_tags,
+        tag_match=tag_match,
+    )
+    order_column = get_order_column(sort_column, match_query)
+    order_dir = "DESC" if sort_direction.lower() == "desc" else "ASC"
+
+    query = f"""
+        SELECT sort_value, id FROM (
+            SELECT {order_column} AS sort_value, w.id AS id,
+                   ROW_NUMBER() OVER (ORDER BY {order_column} {order_dir}, w.id {order_dir}) AS position
+            {from_clause}
+            WHERE {where_clause}
+        )
+        WHERE position % ? = 0
+        ORDER BY position
+    """
+    params.append(per_page)
+
+    with get_connection(db_path) as conn:
+        cursor = conn.execute(query, params)
+        return [None] + [(row["sort_value"], row["id"]) for row in cursor.fetchall()]
+
+
+@cached_read
 def get_filtered_count(
     db_path: str,
     search_term: Optional[str] = None,
     filter_types: Optional[List[str]] = None,
     filter_disciplines: Optional[List[str]] = None,
     filter_cities: Optional[List[str]] = None,
+    filter_tags: Optional[Dict[str, List[str]]] = None,
+    tag_match: str = "any",
 ) -> int:
     """Get count of organizations matching filters."""
     query, params = build_query(
         search_term=search_term,
         filter_types=filter_types,
-        filter_disciplines=filter_disciplines,
         filter_cities=filter_cities,
+        filter_ids=resolve_tag_filter(db_path, filter_disciplines, filter_tags, tag_match),
         count_only=True,
     )
 
@@ -235,18 +820,24 @@ def get_filtered_count(
         return cursor.fetchone()[0]
 
 
+def _fetch_organization(conn: sqlite3.Connection, org_id: int) -> Optional[Dict[str, Any]]:
+    """Fetch the main websites row on an open connection."""
+    cursor = conn.execute("SELECT * FROM websites WHERE id = ?", (org_id,))
+    row = cursor.fetchone()
+    if row:
+        return dict(row)
+    return None
+
+
+@cached_read
 def get_organization_by_id(db_path: str, org_id: int) -> Optional[Dict[str, Any]]:
     """Get full organization record by ID."""
     with get_connection(db_path) as conn:
-        cursor = conn.execute("SELECT * FROM websites WHERE id = ?", (org_id,))
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
+        return _fetch_organization(conn, org_id)
 
 
-def get_organization_tags(db_path: str, org_id: int) -> Dict[str, List[str]]:
-    """Get all tags for an organization."""
+def _fetch_tags(conn: sqlite3.Connection, org_id: int) -> Dict[str, List[str]]:
+    """Fetch all tags for an organization on an open connection."""
     tags = {
         "disciplines": [],
         "themes": [],
@@ -255,32 +846,38 @@ def get_organization_tags(db_path: str, org_id: int) -> Dict[str, List[str]]:
         "content_types": [],
     }
 
-    with get_connection(db_path) as conn:
-        # Disciplines
-        cursor = conn.execute("SELECT discipline FROM tag_disciplines WHERE website_id = ?", (org_id,))
-        tags["disciplines"] = [row["discipline"] for row in cursor.fetchall()]
+    # Disciplines
+    cursor = conn.execute("SELECT discipline FROM tag_disciplines WHERE website_id = ?", (org_id,))
+    tags["disciplines"] = [row["discipline"] for row in cursor.fetchall()]
 
-        # Themes
-        cursor = conn.execute("SELECT theme FROM tag_themes WHERE website_id = ?", (org_id,))
-        tags["themes"] = [row["theme"] for row in cursor.fetchall()]
+    # Themes
+    cursor = conn.execute("SELECT theme FROM tag_themes WHERE website_id = ?", (org_id,))
+    tags["themes"] = [row["theme"] for row in cursor.fetchall()]
 
-        # Geographic
-        cursor = conn.execute("SELECT region FROM tag_geographic WHERE website_id = ?", (org_id,))
-        tags["geographic"] = [row["region"] for row in cursor.fetchall()]
+    # Geographic
+    cursor = conn.execute("SELECT region FROM tag_geographic WHERE website_id = ?", (org_id,))
+    tags["geographic"] = [row["region"] for row in cursor.fetchall()]
 
-        # Audience
-        cursor = conn.execute("SELECT audience FROM tag_audience WHERE website_id = ?", (org_id,))
-        tags["audience"] = [row["audience"] for row in cursor.fetchall()]
+    # Audience
+    cursor = conn.execute("SELECT audience FROM tag_audience WHERE website_id = ?", (org_id,))
+    tags["audience"] = [row["audience"] for row in cursor.fetchall()]
 
-        # Content types
-        cursor = conn.execute("SELECT content_type FROM tag_content_types WHERE website_id = ?", (org_id,))
-        tags["content_types"] = [row["content_type"] for row in cursor.fetchall()]
+    # Content types
+    cursor = conn.execute("SELECT content_type FROM tag_content_types WHERE website_id = ?", (org_id,))
+    tags["content_types"] = [row["content_type"] for row in cursor.fetchall()]
 
     return tags
 
 
-def get_organization_related_data(db_path: str, org_id: int) -> Dict[str, Any]:
-    """Get all related data for an organization."""
+@cached_read
+def get_organization_tags(db_path: str, org_id: int) -> Dict[str, List[str]]:
+    """Get all tags for an organization."""
+    with get_connection(db_path) as conn:
+        return _fetch_tags(conn, org_id)
+
+
+def _fetch_related(conn: sqlite3.Connection, org_id: int) -> Dict[str, Any]:
+    """Fetch all related data for an organization on an open connection."""
     related = {
         "programs": [],
         "research_areas": [],
@@ -290,67 +887,211 @@ def get_organization_related_data(db_path: str, org_id: int) -> Dict[str, Any]:
         "languages": [],
     }
 
-    with get_connection(db_path) as conn:
-        # Programs
-        cursor = conn.execute("SELECT program FROM programs WHERE website_id = ?", (org_id,))
-        related["programs"] = [row["program"] for row in cursor.fetchall()]
+    # Programs
+    cursor = conn.execute("SELECT program FROM programs WHERE website_id = ?", (org_id,))
+    related["programs"] = [row["program"] for row in cursor.fetchall()]
 
-        # Research areas
-        cursor = conn.execute("SELECT area FROM research_areas WHERE website_id = ?", (org_id,))
-        related["research_areas"] = [row["area"] for row in cursor.fetchall()]
+    # Research areas
+    cursor = conn.execute("SELECT area FROM research_areas WHERE website_id = ?", (org_id,))
+    related["research_areas"] = [row["area"] for row in cursor.fetchall()]
 
-        # Partners
-        cursor = conn.execute("SELECT partner_name FROM partners WHERE website_id = ?", (org_id,))
-        related["partners"] = [row["partner_name"] for row in cursor.fetchall()]
+    # Partners
+    cursor = conn.execute("SELECT partner_name FROM partners WHERE website_id = ?", (org_id,))
+    related["partners"] = [row["partner_name"] for row in cursor.fetchall()]
 
-        # Events
-        cursor = conn.execute(
-            "SELECT name, type, date, recurring FROM events WHERE website_id = ?",
-            (org_id,)
-        )
-        related["events"] = [dict(row) for row in cursor.fetchall()]
+    # Events
+    cursor = conn.execute(
+        "SELECT name, type, date, recurring FROM events WHERE website_id = ?",
+        (org_id,)
+    )
+    related["events"] = [dict(row) for row in cursor.fetchall()]
 
-        # Focus areas
-        cursor = conn.execute("SELECT area FROM focus_areas WHERE website_id = ?", (org_id,))
-        related["focus_areas"] = [row["area"] for row in cursor.fetchall()]
+    # Focus areas
+    cursor = conn.execute("SELECT area FROM focus_areas WHERE website_id = ?", (org_id,))
+    related["focus_areas"] = [row["area"] for row in cursor.fetchall()]
 
-        # Languages
-        cursor = conn.execute("SELECT language_code FROM website_languages WHERE website_id = ?", (org_id,))
-        related["languages"] = [row["language_code"] for row in cursor.fetchall()]
+    # Languages
+    cursor = conn.execute("SELECT language_code FROM website_languages WHERE website_id = ?", (org_id,))
+    related["languages"] = [row["language_code"] for row in cursor.fetchall()]
 
     return related
 
 
+@cached_read
+def get_organization_related_data(db_path: str, org_id: int) -> Dict[str, Any]:
+    """Get all related data for an organization."""
+    with get_connection(db_path) as conn:
+        return _fetch_related(conn, org_id)
+
+
+@cached_read
 def get_full_organization_data(db_path: str, org_id: int) -> Optional[Dict[str, Any]]:
     """Get complete organization data including tags and related data."""
-    org = get_organization_by_id(db_path, org_id)
-    if not org:
-        return None
+    with get_connection(db_path) as conn:
+        org = _fetch_organization(conn, org_id)
+        if not org:
+            return None
 
-    org["tags"] = get_organization_tags(db_path, org_id)
-    org["related"] = get_organization_related_data(db_path, org_id)
+        org["tags"] = _fetch_tags(conn, org_id)
+        org["related"] = _fetch_related(conn, org_id)
+        org["crawl"] = _fetch_crawl(conn, org_id)
     return org
 
 
+# Tag and related-data keys mapped to their (table, value column)
+TAG_TABLES = {
+    "disciplines": ("tag_disciplines", "discipline"),
+    "themes": ("tag_themes", "theme"),
+    "geographic": ("tag_geographic", "region"),
+    "audience": ("tag_audience", "audience"),
+    "content_types": ("tag_content_types", "content_type"),
+}
+
+RELATED_TABLES = {
+    "programs": ("programs", "program"),
+    "research_areas": ("research_areas", "area"),
+    "partners": ("partners", "partner_name"),
+    "focus_areas": ("focus_areas", "area"),
+    "languages": ("website_languages", "language_code"),
+}
+
+EVENT_COLUMNS = ["name", "type", "date", "recurring"]
+
+# Crawler output kept with the full record (not editable), so deleted
+# organizations can be restored with it
+CRAWL_TABLES = {
+    "pages_crawled": ("pages_crawled", "url"),
+    "extraction_errors": ("extraction_errors", "error"),
+}
+
+
+def _fetch_crawl(conn: sqlite3.Connection, org_id: int) -> Dict[str, List[str]]:
+    """Fetch the crawled pages and extraction errors of an organization."""
+    return {
+        key: [row[0] for row in conn.execute(f"SELECT {column} FROM {table} WHERE website_id = ?", (org_id,))]
+        for key, (table, column) in CRAWL_TABLES.items()
+    }
+
+# Stay well below SQLite's bound-variable limit (999 on older builds)
+MAX_QUERY_VARIABLES = 900
+
+
+def chunked(values: List[Any], size: int = MAX_QUERY_VARIABLES):
+    """Yield successive chunks of at most size values."""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _fetch_organizations_bulk(conn: sqlite3.Connection, org_ids: List[int]) -> List[Dict[str, Any]]:
+    """Fetch full records for many organizations with one query per table and chunk."""
+    orgs = {}
+    for chunk in chunked(org_ids):
+        placeholders = ", ".join(["?" for _ in chunk])
+        cursor = conn.execute(f"SELECT * FROM websites WHERE id IN ({placeholders})", chunk)
+        for row in cursor.fetchall():
+            org = dict(row)
+            org["tags"] = {key: [] for key in TAG_TABLES}
+            org["related"] = {
+                "programs": [],
+                "research_areas": [],
+                "partners": [],
+                "events": [],
+                "focus_areas": [],
+                "languages": [],
+            }
+            org["crawl"] = {key: [] for key in CRAWL_TABLES}
+            orgs[org["id"]] = org
+
+    found_ids = list(orgs)
+    for chunk in chunked(found_ids):
+        placeholders = ", ".join(["?" for _ in chunk])
+
+        for key, (table, column) in TAG_TABLES.items():
+            cursor = conn.execute(
+                f"SELECT website_id, {column} FROM {table} WHERE website_id IN ({placeholders})", chunk
+            )
+            for website_id, value in cursor.fetchall():
+                orgs[website_id]["tags"][key].append(value)
+
+        for key, (table, column) in RELATED_TABLES.items():
+            cursor = conn.execute(
+                f"SELECT website_id, {column} FROM {table} WHERE website_id IN ({placeholders})", chunk
+            )
+            for website_id, value in cursor.fetchall():
+                orgs[website_id]["related"][key].append(value)
+
+        for key, (table, column) in CRAWL_TABLES.items():
+            cursor = conn.execute(
+                f"SELECT website_id, {column} FROM {table} WHERE website_id IN ({placeholders})", chunk
+            )
+            for website_id, value in cursor.fetchall():
+                orgs[website_id]["crawl"][key].append(value)
+
+        cursor = conn.execute(
+            f"SELECT website_id, {', '.join(EVENT_COLUMNS)} FROM events WHERE website_id IN ({placeholders})",
+            chunk,
+        )
+        for row in cursor.fetchall():
+            event = dict(row)
+            orgs[event.pop("website_id")]["related"]["events"].append(event)
+
+    # Keep the caller's order and drop ids that no longer exist
+    return [orgs[org_id] for org_id in org_ids if org_id in orgs]
+
+
+def get_full_organizations_data(db_path: str, org_ids: List[int]) -> List[Dict[str, Any]]:
+    """Get complete data for many organizations, in the order of org_ids.
+
+    Missing ids are skipped. websites and each child table are read once per
+    chunk of ids instead of once per organization. Not cached: results can
+    hold whole tables and would be deep-copied on every hit.
+    """
+    org_ids = list(dict.fromkeys(org_ids))
+    if not org_ids:
+        return []
+
+    with get_connection(db_path) as conn:
+        return _fetch_organizations_bulk(conn, org_ids)
+
+
+def iter_full_organizations_data(
+    db_path: str,
+    org_ids: List[int],
+    chunk_size: int = 200,
+) -> Iterator[Dict[str, Any]]:
+    """Yield complete data for many organizations, in the order of org_ids.
+
+    Records are loaded chunk_size at a time and not cached, so a consumer
+    such as a streamed PDF export holds one chunk in memory at most.
+    """
+    org_ids = list(dict.fromkeys(org_ids))
+    for chunk in chunked(org_ids, chunk_size):
+        with get_connection(db_path) as conn:
+            organizations = _fetch_organizations_bulk(conn, chunk)
+        yield from organizations
+
+
+# Columns of websites that the edit form may change
+EDITABLE_FIELDS = [
+    "name_official", "name_short", "name_local", "description_en", "description_local",
+    "type_primary", "type_secondary", "parent_organization", "founding_year",
+    "phone", "fax", "email", "email_press", "email_careers", "contact_page_url",
+    "street", "city", "postal_code", "state_region", "country_code", "country_name",
+    "raw_address", "contact_name", "contact_position", "contact_position_normalized",
+    "contact_email", "contact_phone", "publications_page", "library_archive_url",
+    "student_count", "staff_count", "events_page_url", "twitter", "linkedin",
+    "facebook", "youtube", "social_other", "latitude", "longitude", "geo_source",
+    "geo_confidence", "organization_scope"
+]
+
+
 def update_organization(db_path: str, org_id: int, data: Dict[str, Any]) -> bool:
     """Update organization main record."""
     # Build update query dynamically
-    fields = [
-        "name_official", "name_short", "name_local", "description_en", "description_local",
-        "type_primary", "type_secondary", "parent_organization", "founding_year",
-        "phone", "fax", "email", "email_press", "email_careers", "contact_page_url",
-        "street", "city", "postal_code", "state_region", "country_code", "country_name",
-        "raw_address", "contact_name", "contact_position", "contact_position_normalized",
-        "contact_email", "contact_phone", "publications_page", "library_archive_url",
-        "student_count", "staff_count", "events_page_url", "twitter", "linkedin",
-        "facebook", "youtube", "social_other", "latitude", "longitude", "geo_source",
-        "geo_confidence", "organization_scope"
-    ]
-
     update_fields = []
     params = []
 
-    for field in fields:
+    for field in EDITABLE_FIELDS:
         if field in data:
             update_fields.append(f"{field} = ?")
             params.append(data[field])
@@ -361,28 +1102,105 @@ def update_organization(db_path: str, org_id: int, data: Dict[str, Any]) -> bool
     params.append(org_id)
     query = f"UPDATE websites SET {', '.join(update_fields)} WHERE id = ?"
 
-    with get_connection(db_path) as conn:
+    def write(conn: sqlite3.Connection):
         conn.execute(query, params)
-        conn.commit()
-        return True
+
+    run_write(db_path, write)
+    return True
+
+
+def _normalize_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep named events with exactly the stored event columns."""
+    return [
+        {
+            "name": event.get("name"),
+            "type": event.get("type"),
+            "date": event.get("date"),
+            "recurring": event.get("recurring", 0),
+        }
+        for event in events
+        if event.get("name")
+    ]
+
+
+def save_organization(
+    db_path: str, org_id: int, changes: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Save an edited organization in a single transaction.
+
+    changes holds new values for any of EDITABLE_FIELDS plus optional
+    "tags" and "related" dicts keyed like get_full_organization_data().
+    Only the websites columns and child tables whose values differ from the
+    stored record are written. Returns the full record as read inside the
+    write transaction, before the edit, and the calculate_changes() diff.
+    """
+    from utils.logger import calculate_changes
+
+    def write(conn: sqlite3.Connection):
+        before = _fetch_organization(conn, org_id)
+        if before is None:
+            raise ValueError(f"Organization {org_id} not found")
+        before["tags"] = _fetch_tags(conn, org_id)
+        before["related"] = _fetch_related(conn, org_id)
+        before["crawl"] = _fetch_crawl(conn, org_id)
+
+        after = {**before, "tags": dict(before["tags"]), "related": dict(before["related"])}
+        for field in EDITABLE_FIELDS:
+            if field in changes:
+                after[field] = changes[field]
+        for key, values in changes.get("tags", {}).items():
+            if key in TAG_TABLES:
+                after["tags"][key] = [value for value in values if value]
+        for key, values in changes.get("related", {}).items():
+            if key == "events":
+                after["related"][key] = _normalize_events(values)
+            elif key in RELATED_TABLES:
+                after["related"][key] = [value for value in values if value]
+
+        # Main record: only columns that actually changed
+        changed_fields = [field for field in EDITABLE_FIELDS if after[field] != before[field]]
+        if changed_fields:
+            assignments = ", ".join(f"{field} = ?" for field in changed_fields)
+            conn.execute(
+                f"UPDATE websites SET {assignments} WHERE id = ?",
+                [after[field] for field in changed_fields] + [org_id],
+            )
+
+        # Child tables: replace only the lists that changed
+        for section, tables in (("tags", TAG_TABLES), ("related", RELATED_TABLES)):
+            for key, (table, column) in tables.items():
+                if after[section][key] == before[section][key]:
+                    continue
+                conn.execute(f"DELETE FROM {table} WHERE website_id = ?", (org_id,))
+                conn.executemany(
+                    f"INSERT INTO {table} (website_id, {column}) VALUES (?, ?)",
+                    [(org_id, value) for value in after[section][key]],
+                )
+
+        if after["related"]["events"] != before["related"]["events"]:
+            conn.execute("DELETE FROM events WHERE website_id = ?", (org_id,))
+            conn.executemany(
+                "INSERT INTO events (website_id, name, type, date, recurring) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (org_id, event["name"], event["type"], event["date"], event["recurring"])
+                    for event in after["related"]["events"]
+                ],
+            )
+
+        return before, after
+
+    before, after = run_write(db_path, write)
+    return before, calculate_changes(before, after)
 
 
 def update_organization_tags(db_path: str, org_id: int, tag_type: str, values: List[str]):
     """Update organization tags."""
-    table_map = {
-        "disciplines": ("tag_disciplines", "discipline"),
-        "themes": ("tag_themes", "theme"),
-        "geographic": ("tag_geographic", "region"),
-        "audience": ("tag_audience", "audience"),
-        "content_types": ("tag_content_types", "content_type"),
-    }
-
-    if tag_type not in table_map:
+    if tag_type not in TAG_TABLES:
         return
 
-    table, column = table_map[tag_type]
+    table, column = TAG_TABLES[tag_type]
 
-    with get_connection(db_path) as conn:
+    def write(conn: sqlite3.Connection):
         # Delete existing
         conn.execute(f"DELETE FROM {table} WHERE website_id = ?", (org_id,))
 
@@ -393,12 +1211,13 @@ def update_organization_tags(db_path: str, org_id: int, tag_type: str, values: L
                     f"INSERT INTO {table} (website_id, {column}) VALUES (?, ?)",
                     (org_id, value)
                 )
-        conn.commit()
+
+    run_write(db_path, write)
 
 
 def update_organization_programs(db_path: str, org_id: int, programs: List[str]):
     """Update organization programs."""
-    with get_connection(db_path) as conn:
+    def write(conn: sqlite3.Connection):
         conn.execute("DELETE FROM programs WHERE website_id = ?", (org_id,))
         for program in programs:
             if program:
@@ -406,12 +1225,13 @@ def update_organization_programs(db_path: str, org_id: int, programs: List[str])
                     "INSERT INTO programs (website_id, program) VALUES (?, ?)",
                     (org_id, program)
                 )
-        conn.commit()
+
+    run_write(db_path, write)
 
 
 def update_organization_research_areas(db_path: str, org_id: int, areas: List[str]):
     """Update organization research areas."""
-    with get_connection(db_path) as conn:
+    def write(conn: sqlite3.Connection):
         conn.execute("DELETE FROM research_areas WHERE website_id = ?", (org_id,))
         for area in areas:
             if area:
@@ -419,12 +1239,13 @@ def update_organization_research_areas(db_path: str, org_id: int, areas: List[st
                     "INSERT INTO research_areas (website_id, area) VALUES (?, ?)",
                     (org_id, area)
                 )
-        conn.commit()
+
+    run_write(db_path, write)
 
 
 def update_organization_partners(db_path: str, org_id: int, partners: List[str]):
     """Update organization partners."""
-    with get_connection(db_path) as conn:
+    def write(conn: sqlite3.Connection):
         conn.execute("DELETE FROM partners WHERE website_id = ?", (org_id,))
         for partner in partners:
             if partner:
@@ -432,12 +1253,13 @@ def update_organization_partners(db_path: str, org_id: int, partners: List[str])
                     "INSERT INTO partners (website_id, partner_name) VALUES (?, ?)",
                     (org_id, partner)
                 )
-        conn.commit()
+
+    run_write(db_path, write)
 
 
 def update_organization_events(db_path: str, org_id: int, events: List[Dict[str, Any]]):
     """Update organization events."""
-    with get_connection(db_path) as conn:
+    def write(conn: sqlite3.Connection):
         conn.execute("DELETE FROM events WHERE website_id = ?", (org_id,))
         for event in events:
             if event.get("name"):
@@ -445,35 +1267,181 @@ def update_organization_events(db_path: str, org_id: int, events: List[Dict[str,
                     "INSERT INTO events (website_id, name, type, date, recurring) VALUES (?, ?, ?, ?, ?)",
                     (org_id, event.get("name"), event.get("type"), event.get("date"), event.get("recurring", 0))
                 )
-        conn.commit()
+
+    run_write(db_path, write)
+
+
+def get_child_tables(conn: sqlite3.Connection) -> List[str]:
+    """Get every table that references websites through a website_id column."""
+    cursor = conn.execute("""
+        SELECT m.name
+        FROM sqlite_master m
+        JOIN pragma_table_info(m.name) p
+        WHERE m.type = 'table' AND p.name = 'website_id'
+        ORDER BY m.name
+    """)
+    return [row["name"] for row in cursor.fetchall()]
+
+
+def _delete_marked(conn: sqlite3.Connection) -> int:
+    """Delete the websites whose ids are in temp.delete_ids, plus all child rows."""
+    for table in get_child_tables(conn):
+        conn.execute(f"DELETE FROM {table} WHERE website_id IN (SELECT id FROM temp.delete_ids)")
+    cursor = conn.execute("DELETE FROM websites WHERE id IN (SELECT id FROM temp.delete_ids)")
+    return cursor.rowcount
+
+
+def _run_bulk_delete(
+    db_path: str,
+    mark_ids,
+    on_records: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+    chunk_size: int = 200,
+) -> List[int]:
+    """Run a set-based delete in one transaction and return the deleted ids.
+
+    mark_ids(conn) fills temp.delete_ids with the ids to delete. With
+    on_records, the full records of the deleted rows are read inside the
+    transaction, chunk_size at a time, into a temporary file, and passed
+    to on_records chunk by chunk only once the delete has committed. They
+    can then be logged without holding them all in memory, and nothing is
+    logged for a delete that was rolled back.
+    """
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+        def write(conn: sqlite3.Connection) -> List[int]:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS delete_ids (id INTEGER PRIMARY KEY)")
+            conn.execute("DELETE FROM temp.delete_ids")
+            mark_ids(conn)
+            deleted_ids = [row["id"] for row in conn.execute(
+                "SELECT d.id FROM temp.delete_ids d JOIN websites w ON w.id = d.id"
+            ).fetchall()]
+            if on_records is not None:
+                spool.seek(0)
+                spool.truncate()
+                for chunk in chunked(deleted_ids, chunk_size):
+                    spool.write(json.dumps(_fetch_organizations_bulk(conn, chunk)) + "\n")
+            _delete_marked(conn)
+            conn.execute("DELETE FROM temp.delete_ids")
+            return deleted_ids
+
+        deleted_ids = run_write(db_path, write)
+        if on_records is not None:
+            spool.seek(0)
+            for line in spool:
+                on_records(json.loads(line))
+    return deleted_ids
 
 
 def delete_organization(db_path: str, org_id: int) -> bool:
     """Delete an organization and all related data."""
-    with get_connection(db_path) as conn:
-        # Delete from tag tables
-        conn.execute("DELETE FROM tag_disciplines WHERE website_id = ?", (org_id,))
-        conn.execute("DELETE FROM tag_themes WHERE website_id = ?", (org_id,))
-        conn.execute("DELETE FROM tag_geographic WHERE website_id = ?", (org_id,))
-        conn.execute("DELETE FROM tag_audience WHERE website_id = ?", (org_id,))
-        conn.execute("DELETE FROM tag_content_types WHERE website_id = ?", (org_id,))
-
-        # Delete from related tables
-        conn.execute("DELETE FROM programs WHERE website_id = ?", (org_id,))
-        conn.execute("DELETE FROM research_areas WHERE website_id = ?", (org_id,))
-        conn.execute("DELETE FROM partners WHERE website_id = ?", (org_id,))
-        conn.execute("DELETE FROM events WHERE website_id = ?", (org_id,))
-        conn.execute("DELETE FROM focus_areas WHERE website_id = ?", (org_id,))
-        conn.execute("DELETE FROM website_languages WHERE website_id = ?", (org_id,))
-
-        # Delete main record
-        conn.execute("DELETE FROM websites WHERE id = ?", (org_id,))
-        conn.commit()
-        return True
+    return delete_organizations(db_path, [org_id])
 
 
 def delete_organizations(db_path: str, org_ids: List[int]) -> bool:
-    """Delete multiple organizations."""
-    for org_id in org_ids:
-        delete_organization(db_path, org_id)
+    """Delete multiple organizations and all their related data in one transaction."""
+    def mark_ids(conn: sqlite3.Connection):
+        conn.executemany(
+            "INSERT OR IGNORE INTO temp.delete_ids (id) VALUES (?)",
+            [(org_id,) for org_id in org_ids],
+        )
+
+    _run_bulk_delete(db_path, mark_ids)
     return True
+
+
+def insert_organizations(db_path: str, records: List[Dict[str, Any]]) -> Tuple[List[int], List[int]]:
+    """Insert complete organizations with their original ids in one transaction.
+
+    records are shaped like get_full_organization_data(): websites columns
+    plus "tags", "related" and "crawl" (missing in records logged before it
+    was captured). Columns the table no longer has are ignored
+    and missing ones take their defaults. Ids that exist already are
+    skipped. Returns (inserted_ids, skipped_ids).
+    """
+    def write(conn: sqlite3.Connection) -> Tuple[List[int], List[int]]:
+        website_columns = [row["name"] for row in conn.execute("PRAGMA table_info(websites)")]
+
+        existing = set()
+        for chunk in chunked([record["id"] for record in records]):
+            placeholders = ", ".join(["?" for _ in chunk])
+            existing.update(
+                row["id"] for row in conn.execute(f"SELECT id FROM websites WHERE id IN ({placeholders})", chunk)
+            )
+
+        new_records = []
+        skipped_ids = []
+        for record in records:
+            if record["id"] in existing:
+                skipped_ids.append(record["id"])
+                continue
+            existing.add(record["id"])
+            new_records.append(record)
+
+        # Records logged under different schema versions carry different columns
+        by_columns: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for record in new_records:
+            columns = tuple(column for column in website_columns if column in record)
+            by_columns.setdefault(columns, []).append(record)
+        for columns, group in by_columns.items():
+            conn.executemany(
+                f"INSERT INTO websites ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                [[record[column] for column in columns] for record in group],
+            )
+
+        for section, tables in (("tags", TAG_TABLES), ("related", RELATED_TABLES), ("crawl", CRAWL_TABLES)):
+            for key, (table, column) in tables.items():
+                conn.executemany(
+                    f"INSERT INTO {table} (website_id, {column}) VALUES (?, ?)",
+                    [
+                        (record["id"], value)
+                        for record in new_records
+                        for value in record.get(section, {}).get(key, [])
+                    ],
+                )
+
+        conn.executemany(
+            "INSERT INTO events (website_id, name, type, date, recurring) VALUES (?, ?, ?, ?, ?)",
+            [
+                (record["id"], event.get("name"), event.get("type"), event.get("date"), event.get("recurring", 0))
+                for record in new_records
+                for event in record.get("related", {}).get("events", [])
+            ],
+        )
+
+        return [record["id"] for record in new_records], skipped_ids
+
+    return run_write(db_path, write)
+
+
+def delete_filtered_organizations(
+    db_path: str,
+    search_term: Optional[str] = None,
+    filter_types: Optional[List[str]] = None,
+    filter_disciplines: Optional[List[str]] = None,
+    filter_cities: Optional[List[str]] = None,
+    filter_tags: Optional[Dict[str, List[str]]] = None,
+    tag_match: str = "any",
+    on_records: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+) -> List[int]:
+    """Delete every organization matching filters, selected inside the database.
+
+    on_records(records) is called after the delete committed with the full
+    records that were deleted, a chunk at a time (e.g. to log them).
+    Returns the deleted ids.
+    """
+    from_clause, where_clause, params, _ = build_filtered_where(
+        db_path,
+        search_term=search_term,
+        filter_types=filter_types,
+        filter_disciplines=filter_disciplines,
+        filter_cities=filter_cities,
+        filter_tags=filter_tags,
+        tag_match=tag_match,
+    )
+
+    def mark_ids(conn: sqlite3.Connection):
+        conn.execute(
+            f"INSERT OR IGNORE INTO temp.delete_ids (id) SELECT w.id {from_clause} WHERE {where_clause}",
+            params,
+        )
+
+    return _run_bulk_delete(db_path, mark_ids, on_records)
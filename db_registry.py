@@ -0,0 +1,138 @@
+"""Cached catalog of the country database files.
+
+get_available_databases() is called many times per rerun, so the catalog
+is kept per folder and the folder is globbed again only when its mtime
+changes. Each entry also records the file's size, mtime, row count and
+schema version.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from config import COUNTRIES, DB_BUSY_TIMEOUT, DB_FOLDER, DB_REGISTRY_STAT_INTERVAL
+
+
+def _read_database_details(path: Path) -> dict:
+    """Read the record count and schema version of a database file (read-only)."""
+    details = {"row_count": None, "schema_version": None}
+    try:
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=DB_BUSY_TIMEOUT)
+    except sqlite3.Error:
+        return details
+    try:
+        details["schema_version"] = conn.execute("PRAGMA user_version").fetchone()[0]
+        # Migrated files keep a trigger-maintained total
+        row = None
+        has_totals = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats_totals'"
+        ).fetchone()
+        if has_totals:
+            row = conn.execute("SELECT count FROM stats_totals WHERE name = 'websites'").fetchone()
+        if row is None:
+            row = conn.execute("SELECT COUNT(*) FROM websites").fetchone()
+        details["row_count"] = row[0]
+    except sqlite3.Error:
+        pass
+    finally:
+        conn.close()
+    return details
+
+
+class DatabaseRegistry:
+    """Cached catalog of the country databases in one folder.
+
+    The folder is globbed again only when its mtime changes (a file was
+    added, removed or renamed). Size, mtime, row count and schema version of
+    each file are re-read at most every DB_REGISTRY_STAT_INTERVAL seconds,
+    and row counts only for files whose size or mtime changed.
+    """
+
+    def __init__(self, db_folder: Path):
+        self.db_folder = db_folder
+        self._lock = threading.Lock()
+        self._folder_mtime = None
+        self._checked_at = 0.0
+        self._catalog = {}
+
+    def _scan(self):
+        """Rebuild the catalog, reusing details of unchanged files."""
+        previous = self._catalog
+        catalog = {}
+        for file in self.db_folder.glob("*.db"):
+            code = file.stem.upper()
+            if code not in COUNTRIES:
+                continue
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            entry = {
+                **COUNTRIES[code],
+                "path": str(file),
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+            }
+            old = previous.get(code)
+            if old and (old["path"], old["size"], old["mtime"]) == (entry["path"], entry["size"], entry["mtime"]):
+                entry["row_count"] = old["row_count"]
+                entry["schema_version"] = old["schema_version"]
+            else:
+                entry.update(_read_database_details(file))
+            catalog[code] = entry
+        self._catalog = catalog
+
+    def get(self, force: bool = False) -> dict:
+        """Get the catalog, rescanning only when the folder or the interval says so.
+
+        The returned dict is shared between callers and must not be modified.
+        """
+        try:
+            folder_mtime = os.stat(self.db_folder).st_mtime_ns
+        except FileNotFoundError:
+            folder_mtime = None
+
+        now = time.monotonic()
+        if (
+            not force
+            and folder_mtime == self._folder_mtime
+            and now - self._checked_at < DB_REGISTRY_STAT_INTERVAL
+        ):
+            return self._catalog
+
+        with self._lock:
+            if force or folder_mtime != self._folder_mtime or now - self._checked_at >= DB_REGISTRY_STAT_INTERVAL:
+                if folder_mtime is None:
+                    self._catalog = {}
+                else:
+                    self._scan()
+                    # Reading a WAL database may create its -shm file; don't rescan for that
+                    folder_mtime = os.stat(self.db_folder).st_mtime_ns
+                self._folder_mtime = folder_mtime
+                self._checked_at = now
+        return self._catalog
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_database_registry(db_folder=None) -> DatabaseRegistry:
+    """Get the process-wide registry for a database folder."""
+    key = str(db_folder if db_folder is not None else DB_FOLDER)
+    registry = _registries.get(key)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.setdefault(key, DatabaseRegistry(Path(key)))
+    return registry
+
+
+def get_available_databases(db_folder=None, refresh: bool = False):
+    """Get the available database files by country code.
+
+    Each entry has the country name and flag, path, size, mtime, row_count
+    and schema_version. The catalog is cached; pass refresh to rescan now.
+    """
+    return get_database_registry(db_folder).get(force=refresh)
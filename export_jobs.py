@@ -0,0 +1,253 @@
+"""Background PDF export jobs.
+
+Multi-organization exports run on a small process-wide thread pool instead
+of inside the Streamlit script run, so the page stays responsive and a
+rerun does not throw the work away. Sessions keep only the job id; the job
+itself (progress, result, errors) lives here until it is discarded or
+expires. Results are file objects; very large PDF exports are streamed
+from the database into a temporary file instead of being built in memory.
+"""
+
+import io
+import itertools
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, List, Optional
+
+from config import PDF_EXPORT_JOB_TTL, PDF_EXPORT_WORKERS, PDF_STREAM_MIN_ORGS
+from database import get_full_organizations_data, iter_full_organizations_data
+from components.pdf_generator import generate_multi_pdf_parallel, generate_pdf_zip, stream_multi_pdf
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# Output formats: renderer and MIME type
+OUTPUT_FORMATS = {
+    "pdf": (generate_multi_pdf_parallel, "application/pdf"),
+    "zip": (generate_pdf_zip, "application/zip"),
+}
+
+
+class ExportCancelled(Exception):
+    """Raised inside a job to stop rendering after cancel_job()."""
+
+
+class _ResultReader(io.RawIOBase):
+    """Read-only view of an export file with its own position.
+
+    Reads use os.pread on a duplicated descriptor, so several readers of
+    the same export (e.g. two downloads) never move each other's offset,
+    and closing the job's file does not pull the data from under a reader.
+    """
+
+    def __init__(self, fileno: int):
+        super().__init__()
+        self._fd = os.dup(fileno)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = os.pread(self._fd, len(buffer), self._position)
+        buffer[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += os.fstat(self._fd).st_size
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self._position = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self):
+        if not self.closed:
+            os.close(self._fd)
+        super().close()
+
+
+class ExportJob:
+    """State of one PDF export, shared between the worker and the UI."""
+
+    def __init__(self, db_path: str, country_code: str, org_ids: List[int], filename: str, output: str = "pdf"):
+        self.id = uuid.uuid4().hex
+        self.db_path = db_path
+        self.country_code = country_code
+        self.org_ids = list(org_ids)
+        self.filename = filename
+        self.output = output
+        self.mime = OUTPUT_FORMATS[output][1]
+        self.status = QUEUED
+        self.done = 0
+        self.total = len(self.org_ids)
+        self.result: Optional[BinaryIO] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.cancel_event = threading.Event()
+        self._result_lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        """Check whether the job has stopped, successfully or not."""
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of organizations rendered so far."""
+        return self.done / self.total if self.total else 0.0
+
+    def open_result(self) -> BinaryIO:
+        """Get a reader over the finished export, e.g. for st.download_button.
+
+        Every call returns a new reader with its own position, so
+        concurrent downloads of one job do not interfere. In-memory results
+        are copied into a fresh BytesIO; spooled files are read from disk
+        (an in-memory spool moves there first). st.download_button still
+        reads the whole export into one bytes object when it serves it.
+        """
+        with self._result_lock:
+            if self.result is None:
+                return io.BytesIO()
+            if isinstance(self.result, io.BytesIO):
+                return io.BytesIO(self.result.getvalue())
+            return _ResultReader(self.result.fileno())
+
+    def close_result(self):
+        """Release the export file."""
+        with self._result_lock:
+            if self.result is not None:
+                self.result.close()
+                self.result = None
+
+
+_executor = ThreadPoolExecutor(max_workers=PDF_EXPORT_WORKERS, thread_name_prefix="pdf-export")
+_jobs: Dict[str, ExportJob] = {}
+_jobs_lock = threading.Lock()
+
+
+def _stream_pdf(job: ExportJob, on_progress) -> BinaryIO:
+    """Render a large PDF export from the database straight into a temporary file."""
+    organizations = iter_full_organizations_data(job.db_path, job.org_ids)
+    first = next(organizations, None)
+    if first is None:
+        raise ValueError("No organizations found")
+    return stream_multi_pdf(
+        itertools.chain([first], organizations),
+        job.country_code,
+        job.total,
+        on_progress=on_progress,
+    )
+
+
+def _run_job(job: ExportJob):
+    """Render a job's PDF on a worker thread."""
+    if job.cancel_event.is_set():
+        job.status = CANCELLED
+        job.finished_at = time.time()
+        return
+
+    job.status = RUNNING
+
+    def on_progress(done: int, total: int):
+        if job.cancel_event.is_set():
+            raise ExportCancelled()
+        job.done = done
+
+    try:
+        if job.output == "pdf" and job.total >= PDF_STREAM_MIN_ORGS:
+            job.result = _stream_pdf(job, on_progress)
+        else:
+            organizations = get_full_organizations_data(job.db_path, job.org_ids)
+            job.total = len(organizations)
+            if not organizations:
+                raise ValueError("No organizations found")
+            render = OUTPUT_FORMATS[job.output][0]
+            job.result = render(organizations, job.country_code, on_progress=on_progress)
+        job.done = job.total
+        job.status = DONE
+    except ExportCancelled:
+        job.status = CANCELLED
+    except Exception as e:
+        job.error = str(e)
+        job.status = FAILED
+    finally:
+        job.finished_at = time.time()
+        # discard_job() only closes the results of finished jobs
+        with _jobs_lock:
+            discarded = job.id not in _jobs
+        if discarded:
+            job.close_result()
+
+
+def _prune_jobs():
+    """Forget finished jobs older than PDF_EXPORT_JOB_TTL."""
+    cutoff = time.time() - PDF_EXPORT_JOB_TTL
+    with _jobs_lock:
+        for job_id in [
+            job_id for job_id, job in _jobs.items()
+            if job.finished and job.finished_at < cutoff
+        ]:
+            _jobs.pop(job_id).close_result()
+
+
+def start_export(
+    db_path: str,
+    country_code: str,
+    org_ids: List[int],
+    filename: str,
+    output: str = "pdf",
+) -> str:
+    """Queue an export of the given organizations and return its job id.
+
+    output is "pdf" for one combined document or "zip" for one PDF per
+    organization; both render on worker processes for large selections,
+    and PDFs of PDF_STREAM_MIN_ORGS or more are streamed to a file.
+    """
+    _prune_jobs()
+    job = ExportJob(db_path, country_code, org_ids, filename, output)
+    with _jobs_lock:
+        _jobs[job.id] = job
+    _executor.submit(_run_job, job)
+    return job.id
+
+
+def get_job(job_id: Optional[str]) -> Optional[ExportJob]:
+    """Get a job by id (None if unknown or expired)."""
+    if job_id is None:
+        return None
+    with _jobs_lock:
+        return _jobs.get(job_id)
+
+
+def cancel_job(job_id: str):
+    """Ask a queued or running job to stop; it finishes as cancelled."""
+    job = get_job(job_id)
+    if job is not None:
+        job.cancel_event.set()
+
+
+def discard_job(job_id: str):
+    """Cancel a job if still running and drop it with its result."""
+    cancel_job(job_id)
+    with _jobs_lock:
+        job = _jobs.pop(job_id, None)
+    if job is not None and job.finished:
+        job.close_result()
@@ -0,0 +1,186 @@
+"""Search across every country database at once.
+
+Each database is queried in a worker thread (sqlite3 releases the GIL while
+a query runs) for the first offset + limit rows of its own sorted result
+plus its filtered count. The sorted per-country lists are then merged
+lazily, so only the requested page is assembled and no database has to
+return more rows than the page needs. The page merged from the databases
+finished so far can be reported after each one, to show results early.
+
+When the global replica (replica.py) is available, replica_search answers
+the same request with one query against it instead.
+"""
+
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from config import FEDERATED_MAX_WORKERS
+from database import get_organizations_page
+from replica import get_country_counts, get_source_keys
+
+
+def sort_key(row: Dict[str, Any]) -> Tuple:
+    """Merge key matching SQLite's ORDER BY (NULLs sort first ascending).
+
+    The country code and id break ties, like the id does within one database.
+    """
+    value = row["sort_value"]
+    return (value is not None, value if value is not None else 0, row["country_code"], row["id"])
+
+
+def searchable_databases(databases: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Drop the databases the catalog knows to be empty; they cannot contribute rows."""
+    return {code: info for code, info in databases.items() if info.get("row_count") != 0}
+
+
+def iter_country_results(
+    databases: Dict[str, Dict[str, Any]],
+    filters: Dict[str, Any],
+    sort_column: str = "name_official",
+    sort_direction: str = "asc",
+    limit: int = 20,
+    max_workers: int = FEDERATED_MAX_WORKERS,
+) -> Iterator[Tuple[str, List[Dict[str, Any]], int, Optional[str]]]:
+    """Query every database in parallel, yielding results as each one finishes.
+
+    databases is the get_available_databases() catalog; filters are the
+    keyword filters of get_organizations_page. Yields
+    (country_code, rows, total_count, error) with rows sorted and tagged
+    with country_code. A database that fails for any reason yields no rows
+    and its error, so one bad file does not abort the search.
+    """
+
+    def query(country_code: str, db_path: str):
+        rows, total = get_organizations_page(
+            db_path,
+            **filters,
+            sort_column=sort_column,
+            sort_direction=sort_direction,
+            limit=limit,
+            with_sort_value=True,
+        )
+        for row in rows:
+            row["country_code"] = country_code
+        return rows, total
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="federated") as executor:
+        futures = {
+            executor.submit(query, code, info["path"]): code
+            for code, info in searchable_databases(databases).items()
+        }
+        for future in as_completed(futures):
+            code = futures[future]
+            try:
+                rows, total = future.result()
+            except Exception as e:
+                yield code, [], 0, str(e)
+            else:
+                yield code, rows, total, None
+
+
+def merge_page(
+    per_country: List[List[Dict[str, Any]]],
+    sort_direction: str = "asc",
+    limit: int = 20,
+    offset: int = 0,
+) -> List[Dict[str, Any]]:
+    """Merge sorted per-country rows into one page, without their sort_value.
+
+    The per-country lists are left untouched, so a page can be merged again
+    as more databases finish.
+    """
+    merged = heapq.merge(*per_country, key=sort_key, reverse=sort_direction.lower() == "desc")
+    return [
+        {key: value for key, value in row.items() if key != "sort_value"}
+        for row in itertools.islice(merged, offset, offset + limit)
+    ]
+
+
+def federated_search(
+    databases: Dict[str, Dict[str, Any]],
+    filters: Dict[str, Any],
+    sort_column: str = "name_official",
+    sort_direction: str = "asc",
+    limit: int = 20,
+    offset: int = 0,
+    max_workers: int = FEDERATED_MAX_WORKERS,
+    on_result: Optional[Callable[[str, int, int, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Search all databases and return one merged, sorted page.
+
+    on_result(country_code, finished, total_databases, partial) is called as
+    each database finishes, with partial being the page merged from the
+    databases finished so far, so it can be shown before the search ends.
+    Databases known to be empty are neither searched nor counted in
+    total_databases.
+    Relevance sorting merges per-database bm25 scores, which are only
+    roughly comparable between databases.
+
+    Returns a dict with organizations (tagged with country_code),
+    total_count, country_counts and errors (country code -> message).
+    """
+    databases = searchable_databases(databases)
+    per_country = []
+    country_counts = {}
+    errors = {}
+
+    def page() -> Dict[str, Any]:
+        return {
+            "organizations": merge_page(per_country, sort_direction, limit, offset),
+            "total_count": sum(country_counts.values()),
+            "country_counts": dict(country_counts),
+            "errors": dict(errors),
+        }
+
+    results = iter_country_results(
+        databases,
+        filters,
+        sort_column=sort_column,
+        sort_direction=sort_direction,
+        limit=offset + limit,
+        max_workers=max_workers,
+    )
+    for finished, (code, rows, total, error) in enumerate(results, start=1):
+        if error is not None:
+            errors[code] = error
+        elif total:
+            per_country.append(rows)
+            country_counts[code] = total
+        if on_result is not None:
+            on_result(code, finished, len(databases), page())
+
+    return page()
+
+
+def replica_search(
+    replica_path: str,
+    filters: Dict[str, Any],
+    sort_column: str = "name_official",
+    sort_direction: str = "asc",
+    limit: int = 20,
+    offset: int = 0,
+) -> Dict[str, Any]:
+    """Search the global replica and return a page shaped like federated_search().
+
+    Rows carry the country code and id of their source database.
+    """
+    rows, total = get_organizations_page(
+        replica_path,
+        **filters,
+        sort_column=sort_column,
+        sort_direction=sort_direction,
+        limit=limit,
+        offset=offset,
+    )
+    source_keys = get_source_keys(replica_path, [row["id"] for row in rows])
+    for row in rows:
+        row["country_code"], row["id"] = source_keys[row["id"]]
+
+    return {
+        "organizations": rows,
+        "total_count": total,
+        "country_counts": get_country_counts(replica_path, **filters),
+        "errors": {},
+    }
@@ -0,0 +1,287 @@
+"""Versioned schema migrations for the per-country databases.
+
+The schema version of each file is tracked in ``PRAGMA user_version``.
+Migrations are applied in order the first time a database is opened by the
+connection pool, or for every file at once by running this module:
+
+    python migrations.py [--rebuild-search]
+"""
+
+import argparse
+import sqlite3
+from typing import Callable, List, Tuple
+
+from config import SEARCH_COLUMNS, SORTABLE_COLUMNS
+
+# Child tables keyed by website_id with the columns read alongside it
+CHILD_TABLE_COLUMNS = {
+    "tag_disciplines": ["discipline"],
+    "tag_themes": ["theme"],
+    "tag_geographic": ["region"],
+    "tag_audience": ["audience"],
+    "tag_content_types": ["content_type"],
+    "programs": ["program"],
+    "research_areas": ["area"],
+    "partners": ["partner_name"],
+    "events": ["name", "type", "date", "recurring"],
+    "focus_areas": ["area"],
+    "website_languages": ["language_code"],
+    "pages_crawled": ["url"],
+    "extraction_errors": ["error"],
+}
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    """Check whether a table exists in the database."""
+    cursor = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    )
+    return cursor.fetchone() is not None
+
+
+def _has_index_on(conn: sqlite3.Connection, table: str, columns: List[str]) -> bool:
+    """Check whether an existing index (e.g. from a UNIQUE constraint) starts with columns."""
+    for index in conn.execute(f"PRAGMA index_list({table})").fetchall():
+        indexed = [row[2] for row in conn.execute(f"PRAGMA index_info({index[1]})").fetchall()]
+        if indexed[:len(columns)] == columns:
+            return True
+    return False
+
+
+def _add_indexes(conn: sqlite3.Connection):
+    """Add covering indexes for website_id lookups, filters and sorting."""
+    for table, columns in CHILD_TABLE_COLUMNS.items():
+        if not _table_exists(conn, table):
+            continue
+        indexed = ["website_id"] + columns
+        if _has_index_on(conn, table, indexed):
+            continue
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_website ON {table} ({', '.join(indexed)})"
+        )
+
+    if _table_exists(conn, "tag_disciplines"):
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tag_disciplines_discipline "
+            "ON tag_disciplines (discipline, website_id)"
+        )
+
+    for column in sorted(set(SORTABLE_COLUMNS) | {"city", "type_primary"}):
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_websites_{column} ON websites ({column})")
+
+
+def rebuild_search_index(conn: sqlite3.Connection):
+    """Rebuild the full-text index from the current websites rows."""
+    conn.execute("INSERT INTO websites_fts(websites_fts) VALUES ('rebuild')")
+
+
+def _add_search_index(conn: sqlite3.Connection):
+    """Add the external-content FTS5 index over SEARCH_COLUMNS and its sync triggers."""
+    columns = ", ".join(SEARCH_COLUMNS)
+    new_values = ", ".join(f"new.{column}" for column in SEARCH_COLUMNS)
+    old_values = ", ".join(f"old.{column}" for column in SEARCH_COLUMNS)
+
+    conn.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS websites_fts USING fts5(
+            {columns},
+            content='websites',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS websites_fts_insert AFTER INSERT ON websites BEGIN
+            INSERT INTO websites_fts (rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS websites_fts_delete AFTER DELETE ON websites BEGIN
+            INSERT INTO websites_fts (websites_fts, rowid, {columns})
+            VALUES ('delete', old.id, {old_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS websites_fts_update AFTER UPDATE OF {columns} ON websites BEGIN
+            INSERT INTO websites_fts (websites_fts, rowid, {columns})
+            VALUES ('delete', old.id, {old_values});
+            INSERT INTO websites_fts (rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    rebuild_search_index(conn)
+
+
+def _stats_upsert(dimension: str, value: str, delta: int) -> str:
+    """SQL adding delta to a stats_counts value, skipping NULL and empty values."""
+    return f"""
+        INSERT INTO stats_counts (dimension, value, count)
+        SELECT '{dimension}', {value}, {delta} WHERE {value} IS NOT NULL AND {value} != ''
+        ON CONFLICT (dimension, value) DO UPDATE SET count = count + {delta};
+    """
+
+
+def _stats_decrement(dimension: str, value: str) -> str:
+    """SQL removing one from a stats_counts value and dropping it at zero."""
+    return f"""
+        UPDATE stats_counts SET count = count - 1 WHERE dimension = '{dimension}' AND value = {value};
+        DELETE FROM stats_counts WHERE dimension = '{dimension}' AND value = {value} AND count <= 0;
+    """
+
+
+def _add_statistics_tables(conn: sqlite3.Connection):
+    """Add summary tables for the statistics panel, maintained by triggers.
+
+    stats_counts holds the row count per city, type_primary and discipline;
+    stats_totals holds the websites and tag_disciplines row counts.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS stats_counts (
+            dimension TEXT NOT NULL,
+            value TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (dimension, value)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_stats_counts_count ON stats_counts (dimension, count DESC)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS stats_totals (
+            name TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """)
+
+    # Backfill from the current data
+    conn.execute("DELETE FROM stats_counts")
+    conn.execute("DELETE FROM stats_totals")
+    for dimension in ("city", "type_primary"):
+        conn.execute(f"""
+            INSERT INTO stats_counts (dimension, value, count)
+            SELECT '{dimension}', {dimension}, COUNT(*) FROM websites
+            WHERE {dimension} IS NOT NULL AND {dimension} != ''
+            GROUP BY {dimension}
+        """)
+    conn.execute("""
+        INSERT INTO stats_counts (dimension, value, count)
+        SELECT 'discipline', discipline, COUNT(*) FROM tag_disciplines
+        WHERE discipline IS NOT NULL AND discipline != ''
+        GROUP BY discipline
+    """)
+    conn.execute("INSERT INTO stats_totals SELECT 'websites', COUNT(*) FROM websites")
+    conn.execute("INSERT INTO stats_totals SELECT 'tag_disciplines', COUNT(*) FROM tag_disciplines")
+
+    triggers = {
+        "stats_websites_insert": f"""
+            AFTER INSERT ON websites BEGIN
+                UPDATE stats_totals SET count = count + 1 WHERE name = 'websites';
+                {_stats_upsert("city", "new.city", 1)}
+                {_stats_upsert("type_primary", "new.type_primary", 1)}
+            END
+        """,
+        "stats_websites_delete": f"""
+            AFTER DELETE ON websites BEGIN
+                UPDATE stats_totals SET count = count - 1 WHERE name = 'websites';
+                {_stats_decrement("city", "old.city")}
+                {_stats_decrement("type_primary", "old.type_primary")}
+            END
+        """,
+        "stats_websites_update": f"""
+            AFTER UPDATE OF city, type_primary ON websites BEGIN
+                {_stats_decrement("city", "old.city")}
+                {_stats_upsert("city", "new.city", 1)}
+                {_stats_decrement("type_primary", "old.type_primary")}
+                {_stats_upsert("type_primary", "new.type_primary", 1)}
+            END
+        """,
+        "stats_disciplines_insert": f"""
+            AFTER INSERT ON tag_disciplines BEGIN
+                UPDATE stats_totals SET count = count + 1 WHERE name = 'tag_disciplines';
+                {_stats_upsert("discipline", "new.discipline", 1)}
+            END
+        """,
+        "stats_disciplines_delete": f"""
+            AFTER DELETE ON tag_disciplines BEGIN
+                UPDATE stats_totals SET count = count - 1 WHERE name = 'tag_disciplines';
+                {_stats_decrement("discipline", "old.discipline")}
+            END
+        """,
+        "stats_disciplines_update": f"""
+            AFTER UPDATE OF discipline ON tag_disciplines BEGIN
+                {_stats_decrement("discipline", "old.discipline")}
+                {_stats_upsert("discipline", "new.discipline", 1)}
+            END
+        """,
+    }
+    for name, body in triggers.items():
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+
+# (version, description, migration function), applied in ascending order
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "Add foreign-key, filter and sort indexes", _add_indexes),
+    (2, "Add FTS5 search index over websites", _add_search_index),
+    (3, "Add trigger-maintained statistics tables", _add_statistics_tables),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Get the schema version stored in the database."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(conn: sqlite3.Connection) -> int:
+    """Apply all pending migrations and return the resulting schema version.
+
+    Each migration runs in its own write transaction together with the
+    user_version bump, so concurrent processes never apply one twice.
+    """
+    if get_schema_version(conn) >= SCHEMA_VERSION:
+        return get_schema_version(conn)
+
+    for version, _description, migrate in MIGRATIONS:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if get_schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            migrate(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    return get_schema_version(conn)
+
+
+def migrate_all(db_folder=None, rebuild_search: bool = False):
+    """Apply pending migrations to every available database.
+
+    With rebuild_search, the full-text index is also rebuilt from scratch,
+    e.g. after rows were changed by a tool that bypassed the triggers.
+    """
+    from db_registry import get_available_databases
+
+    for code, info in sorted(get_available_databases(db_folder).items()):
+        conn = sqlite3.connect(info["path"])
+        try:
+            before = get_schema_version(conn)
+            after = apply_migrations(conn)
+            if rebuild_search:
+                rebuild_search_index(conn)
+                conn.commit()
+        finally:
+            conn.close()
+        print(f"{code}: schema version {before} -> {after}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate all databases in the db/ folder.")
+    parser.add_argument("--db-folder", help="Folder containing the <CODE>.db files")
+    parser.add_argument(
+        "--rebuild-search",
+        action="store_true",
+        help="Rebuild the full-text search index of every database",
+    )
+    args = parser.parse_args()
+    migrate_all(args.db_folder, rebuild_search=args.rebuild_search)
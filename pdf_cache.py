@@ -0,0 +1,185 @@
+"""Disk-backed cache of rendered PDFs.
+
+Entries are content-addressed: the key is a hash of the full organization
+data (and the country it was exported from), so an edited record simply
+maps to a new entry and a cached PDF is never served for changed data.
+Single-organization PDFs are stored under ``single/<country>/<id>/`` and
+multi-organization documents under ``multi/`` next to a list of their
+members, so edits and deletes can drop the entries of affected records.
+The cache is bounded in size and evicts least recently used files first.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config import PDF_CACHE_ENABLED, PDF_CACHE_FOLDER, PDF_CACHE_MAX_BYTES
+
+# Bump when the PDF layout changes so old renders are not served
+PDF_CACHE_VERSION = "1"
+
+
+def content_key(kind: str, country_code: str, organizations: List[Dict[str, Any]]) -> str:
+    """Hash the data a PDF is rendered from."""
+    payload = json.dumps(
+        [PDF_CACHE_VERSION, kind, country_code, organizations],
+        sort_keys=True,
+        default=str,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PdfCache:
+    """Size-bounded LRU cache of PDF files on disk.
+
+    Hits touch the file's mtime, and eviction removes the oldest files
+    until the total size is below max_bytes. The running total is kept in
+    memory after one scan of the folder.
+    """
+
+    def __init__(self, folder: Path, max_bytes: int, enabled: bool = True):
+        self.folder = Path(folder)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _single_dir(self, country_code: str, org_id: Any) -> Path:
+        """Folder holding every cached single PDF of one organization."""
+        return self.folder / "single" / country_code / str(org_id)
+
+    def _path(self, kind: str, country_code: str, organizations: List[Dict[str, Any]]) -> Path:
+        """Get the file an entry is stored in."""
+        key = content_key(kind, country_code, organizations)
+        if kind == "single":
+            return self._single_dir(country_code, organizations[0].get("id")) / f"{key}.pdf"
+        return self.folder / "multi" / f"{key}.pdf"
+
+    def get(self, kind: str, country_code: str, organizations: List[Dict[str, Any]]) -> Optional[bytes]:
+        """Get a cached PDF (kind "single" or "multi"), or None."""
+        if not self.enabled:
+            return None
+        path = self._path(kind, country_code, organizations)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return data
+
+    def put(self, kind: str, country_code: str, organizations: List[Dict[str, Any]], data: bytes):
+        """Store a rendered PDF and evict old entries if over the size limit."""
+        if not self.enabled:
+            return
+        path = self._path(kind, country_code, organizations)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write atomically so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        added = len(data)
+
+        if kind == "multi":
+            members = "\n".join(f"{country_code}:{org.get('id')}" for org in organizations)
+            path.with_suffix(".ids").write_text(members, encoding="utf-8")
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += added
+            over_limit = self._total_bytes > self.max_bytes
+        if over_limit:
+            self.evict()
+
+    def _files(self) -> List[Tuple[float, int, Path]]:
+        """List cached PDFs as (mtime, size, path)."""
+        files = []
+        if not self.folder.exists():
+            return files
+        for path in self.folder.rglob("*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _scan_size(self) -> int:
+        """Total size of the cached PDFs on disk."""
+        return sum(size for _, size, _ in self._files())
+
+    def _remove(self, path: Path):
+        """Remove an entry with its member list."""
+        path.unlink(missing_ok=True)
+        path.with_suffix(".ids").unlink(missing_ok=True)
+
+    def evict(self):
+        """Remove least recently used entries until below 90% of max_bytes."""
+        with self._lock:
+            files = sorted(self._files())
+            total = sum(size for _, size, _ in files)
+            target = self.max_bytes * 0.9
+            for _, size, path in files:
+                if total <= target:
+                    break
+                self._remove(path)
+                total -= size
+            self._total_bytes = total
+
+    def invalidate(self, country_code: str, org_ids: Iterable[int]):
+        """Drop every entry containing any of the given organizations."""
+        if not self.folder.exists():
+            return
+        org_ids = list(org_ids)
+        for org_id in org_ids:
+            shutil.rmtree(self._single_dir(country_code, org_id), ignore_errors=True)
+
+        members = {f"{country_code}:{org_id}" for org_id in org_ids}
+        multi_folder = self.folder / "multi"
+        if multi_folder.exists():
+            for ids_path in multi_folder.glob("*.ids"):
+                try:
+                    entry_members = set(ids_path.read_text(encoding="utf-8").splitlines())
+                except FileNotFoundError:
+                    continue
+                if entry_members & members:
+                    self._remove(ids_path.with_suffix(".pdf"))
+
+        with self._lock:
+            self._total_bytes = None
+
+    def clear(self):
+        """Remove every cached PDF."""
+        shutil.rmtree(self.folder, ignore_errors=True)
+        with self._lock:
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get entry count, size and hit/miss counters."""
+        files = self._files()
+        return {
+            "entries": len(files),
+            "bytes": sum(size for _, size, _ in files),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Process-wide cache shared by all sessions
+pdf_cache = PdfCache(PDF_CACHE_FOLDER, PDF_CACHE_MAX_BYTES, enabled=PDF_CACHE_ENABLED)
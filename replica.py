@@ -0,0 +1,391 @@
+"""Consolidated read replica of all country databases.
+
+Every row of every country database is copied into one ``global.db`` with
+the code of its source database in ``source_country`` and its id in that
+database in ``local_id``. Rows get a dense replica id of their own (child
+rows point at the replica id of their organization), so the regular read
+functions in database.py, the search index and the tag index all work on
+the replica unchanged. The pool migrates it like any country database.
+
+Refreshing is incremental: a source file is only read again when its size
+or mtime changed, and then only rows that differ are updated, inserted or
+deleted, so the search index and statistics triggers see just the changes.
+
+    python replica.py [--db-folder DIR] [--target PATH] [--full]
+"""
+
+import argparse
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import DB_BUSY_TIMEOUT, GLOBAL_DB_PATH, SQLITE_JOURNAL_MODE
+from database import build_filtered_where, cached_read, chunked, get_connection
+from db_registry import get_available_databases
+from migrations import CHILD_TABLE_COLUMNS, apply_migrations
+
+# Tables copied into the replica, organizations first so child rows can be mapped
+REPLICA_TABLES = ["websites"] + list(CHILD_TABLE_COLUMNS)
+
+
+def get_source_signature(db_path: str) -> Tuple[int, int]:
+    """Get (size, mtime_ns) of a database file together with its WAL file."""
+    size, mtime = 0, 0
+    for path in (db_path, db_path + "-wal"):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        size += stat.st_size
+        mtime = max(mtime, stat.st_mtime_ns)
+    return size, mtime
+
+
+def _create_sources_table(conn: sqlite3.Connection):
+    """Create the table recording which version of each source was imported."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS replica_sources (
+            country_code TEXT PRIMARY KEY,
+            path TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            user_version INTEGER NOT NULL,
+            row_count INTEGER NOT NULL,
+            refreshed_at TEXT NOT NULL
+        )
+    """)
+
+
+def _ensure_table(conn: sqlite3.Connection, table: str, columns: List[Tuple[str, str]]):
+    """Create a replica table for a source table, or add columns it gained."""
+    exists = conn.execute(
+        "SELECT 1 FROM main.sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    if not exists:
+        column_defs = "".join(f", {name} {declared_type}" for name, declared_type in columns)
+        conn.execute(f"""
+            CREATE TABLE main.{table} (
+                id INTEGER PRIMARY KEY,
+                source_country TEXT NOT NULL,
+                local_id INTEGER NOT NULL{column_defs}
+            )
+        """)
+        conn.execute(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS main.idx_{table}_source "
+            f"ON {table} (source_country, local_id)"
+        )
+        return
+
+    present = {row[1] for row in conn.execute(f"PRAGMA main.table_info({table})")}
+    for name, declared_type in columns:
+        if name not in present:
+            conn.execute(f"ALTER TABLE main.{table} ADD COLUMN {name} {declared_type}")
+
+
+def _sync_table(conn: sqlite3.Connection, table: str, country_code: str, columns: List[str]) -> int:
+    """Bring the replica rows of one source table in line with the attached source.
+
+    Organizations are keyed on their id and rows without one are skipped.
+    Child rows are keyed on their rowid, as not every source declares id as
+    the primary key, so ids may be NULL, and rows whose organization is not
+    in the replica (orphans) are skipped. Returns the number of rows
+    inserted, updated or deleted.
+    """
+    if table == "websites":
+        key = "s.id"
+        source = "src.websites s"
+    else:
+        key = "s.rowid"
+        source = f"src.{table} s"
+    expressions = [f"s.{column}" for column in columns]
+    if table != "websites" and "website_id" in columns:
+        # Child rows reference the replica id of their organization
+        source += " JOIN main.websites w ON w.source_country = :code AND w.local_id = s.website_id"
+        expressions[columns.index("website_id")] = "w.id"
+    source_rows = f"{source} WHERE {key} IS NOT NULL"
+    same_row = " AND ".join(
+        f"g.{column} IS {expression}" for column, expression in zip(columns, expressions)
+    ) or "1"
+    params = {"code": country_code}
+
+    deleted = conn.execute(
+        f"DELETE FROM main.{table} WHERE source_country = :code "
+        f"AND local_id NOT IN (SELECT {key} FROM {source_rows})",
+        params,
+    ).rowcount
+
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS replica_changed (local_id INTEGER PRIMARY KEY)")
+    conn.execute("DELETE FROM temp.replica_changed")
+    changed = conn.execute(
+        f"""
+        INSERT INTO temp.replica_changed (local_id)
+        SELECT {key} FROM {source_rows}
+          AND NOT EXISTS (
+              SELECT 1 FROM main.{table} g
+              WHERE g.source_country = :code AND g.local_id = {key} AND {same_row}
+          )
+        """,
+        params,
+    ).rowcount
+    if not changed:
+        return deleted
+
+    if columns:
+        # Update in place so replica ids (and child references to them) stay stable
+        conn.execute(
+            f"""
+            UPDATE main.{table} AS g
+            SET ({", ".join(columns)}) = ({", ".join(f"c.{column}" for column in columns)})
+            FROM (
+                SELECT {key} AS replica_key{"".join(f", {e} AS {c}" for c, e in zip(columns, expressions))}
+                FROM {source_rows}
+                  AND {key} IN (SELECT local_id FROM temp.replica_changed)
+            ) AS c
+            WHERE g.source_country = :code AND g.local_id = c.replica_key
+            """,
+            params,
+        )
+    conn.execute(
+        f"""
+        INSERT INTO main.{table} (source_country, local_id{"".join(", " + c for c in columns)})
+        SELECT :code, {key}{"".join(", " + e for e in expressions)} FROM {source_rows}
+          AND {key} IN (SELECT local_id FROM temp.replica_changed)
+          AND NOT EXISTS (
+              SELECT 1 FROM main.{table} g WHERE g.source_country = :code AND g.local_id = {key}
+          )
+        """,
+        params,
+    )
+    return deleted + changed
+
+
+def _import_source(conn: sqlite3.Connection, country_code: str, db_path: str, force: bool) -> Optional[int]:
+    """Import the changed rows of one country database.
+
+    Returns the number of changed rows, or None if the source was unchanged.
+    """
+    size, mtime_ns = get_source_signature(db_path)
+    conn.execute("ATTACH DATABASE ? AS src", (Path(db_path).resolve().as_uri() + "?mode=ro",))
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have imported this version meanwhile
+            recorded = conn.execute(
+                "SELECT size, mtime_ns FROM replica_sources WHERE country_code = ?", (country_code,)
+            ).fetchone()
+            if not force and recorded == (size, mtime_ns):
+                conn.rollback()
+                return None
+
+            changes = 0
+            for table in REPLICA_TABLES:
+                source_columns = [
+                    (row[1], row[2]) for row in conn.execute(f"PRAGMA src.table_info({table})")
+                ]
+                if not any(name == "id" for name, _ in source_columns):
+                    continue
+                data_columns = [(name, kind) for name, kind in source_columns if name != "id"]
+                _ensure_table(conn, table, data_columns)
+                changes += _sync_table(conn, table, country_code, [name for name, _ in data_columns])
+
+            user_version = conn.execute("PRAGMA src.user_version").fetchone()[0]
+            row_count = conn.execute("SELECT COUNT(*) FROM src.websites").fetchone()[0]
+            conn.execute(
+                "INSERT OR REPLACE INTO replica_sources "
+                "(country_code, path, size, mtime_ns, user_version, row_count, refreshed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (country_code, str(db_path), size, mtime_ns, user_version, row_count,
+                 datetime.now().isoformat()),
+            )
+            conn.commit()
+            return changes
+        except Exception:
+            conn.rollback()
+            raise
+    finally:
+        conn.execute("DETACH DATABASE src")
+
+
+def _remove_source(conn: sqlite3.Connection, country_code: str):
+    """Drop every row imported from a country database that no longer exists."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        tables = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        for table in reversed(REPLICA_TABLES):
+            if table in tables:
+                conn.execute(f"DELETE FROM {table} WHERE source_country = ?", (country_code,))
+        conn.execute("DELETE FROM replica_sources WHERE country_code = ?", (country_code,))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def get_stale_sources(databases: Dict[str, Dict[str, Any]], target=None) -> List[str]:
+    """Get the country codes whose database changed since it was last imported.
+
+    Codes imported earlier but no longer in databases are included as well.
+    """
+    target = Path(target or GLOBAL_DB_PATH)
+    if not target.exists():
+        return sorted(databases)
+
+    conn = sqlite3.connect(target, timeout=DB_BUSY_TIMEOUT)
+    try:
+        _create_sources_table(conn)
+        recorded = {
+            row[0]: (row[1], row[2])
+            for row in conn.execute("SELECT country_code, size, mtime_ns FROM replica_sources")
+        }
+    finally:
+        conn.close()
+
+    stale = [
+        code for code, info in databases.items()
+        if recorded.get(code) != get_source_signature(info["path"])
+    ]
+    stale.extend(code for code in recorded if code not in databases)
+    return sorted(stale)
+
+
+def refresh_replica(
+    db_folder=None,
+    target=None,
+    full: bool = False,
+) -> Tuple[Dict[str, Optional[int]], Dict[str, str]]:
+    """Bring the replica up to date with the country databases.
+
+    Only databases whose size or mtime changed are read, unless full is set.
+    Each country is imported in its own transaction; one that fails is
+    rolled back, keeps its previously imported rows and stays stale.
+    Returns (changes, errors): the number of changed rows per country code
+    (None if skipped) and the error message of every country that failed.
+    """
+    databases = get_available_databases(db_folder)
+    target = Path(target or GLOBAL_DB_PATH)
+
+    conn = sqlite3.connect(target, timeout=DB_BUSY_TIMEOUT)
+    try:
+        conn.execute(f"PRAGMA journal_mode = {SQLITE_JOURNAL_MODE}")
+        _create_sources_table(conn)
+        conn.commit()
+
+        stale = set(databases) if full else set(get_stale_sources(databases, target))
+        results = {}
+        errors = {}
+        for code, info in sorted(databases.items()):
+            if code not in stale:
+                results[code] = None
+                continue
+            try:
+                results[code] = _import_source(conn, code, info["path"], force=full)
+            except Exception as e:
+                results[code] = None
+                errors[code] = str(e)
+                continue
+            # Indexes, search index and statistics once the tables exist
+            apply_migrations(conn)
+
+        for code in sorted(stale - set(databases)):
+            _remove_source(conn, code)
+            results[code] = 0
+    finally:
+        conn.close()
+    return results, errors
+
+
+_refresh_lock = threading.Lock()
+
+
+def start_refresh(db_folder=None, target=None) -> bool:
+    """Run refresh_replica() on a background thread, unless one is already running.
+
+    Failures are printed instead of raised. Returns whether a refresh was started.
+    """
+    if not _refresh_lock.acquire(blocking=False):
+        return False
+
+    def run():
+        try:
+            _, errors = refresh_replica(db_folder, target)
+            for code, error in errors.items():
+                print(f"Error refreshing replica from {code}: {error}")
+        except Exception as e:
+            print(f"Error refreshing replica: {e}")
+        finally:
+            _refresh_lock.release()
+
+    threading.Thread(target=run, name="replica-refresh", daemon=True).start()
+    return True
+
+
+@cached_read
+def get_replica_sources(replica_path: str) -> Dict[str, Dict[str, Any]]:
+    """Get the imported version of every source database, by country code."""
+    with get_connection(replica_path) as conn:
+        cursor = conn.execute("SELECT * FROM replica_sources ORDER BY country_code")
+        return {row["country_code"]: dict(row) for row in cursor.fetchall()}
+
+
+@cached_read
+def get_source_keys(replica_path: str, replica_ids: List[int]) -> Dict[int, Tuple[str, int]]:
+    """Map replica organization ids to (source country code, id in that database)."""
+    keys = {}
+    with get_connection(replica_path) as conn:
+        for chunk in chunked(replica_ids):
+            placeholders = ",".join("?" * len(chunk))
+            cursor = conn.execute(
+                f"SELECT id, source_country, local_id FROM websites WHERE id IN ({placeholders})",
+                chunk,
+            )
+            for row in cursor.fetchall():
+                keys[row["id"]] = (row["source_country"], row["local_id"])
+    return keys
+
+
+@cached_read
+def get_country_counts(
+    replica_path: str,
+    search_term: Optional[str] = None,
+    filter_types: Optional[List[str]] = None,
+    filter_disciplines: Optional[List[str]] = None,
+    filter_cities: Optional[List[str]] = None,
+    filter_tags: Optional[Dict[str, List[str]]] = None,
+    tag_match: str = "any",
+) -> Dict[str, int]:
+    """Count organizations matching filters per source country."""
+    from_clause, where_clause, params, _ = build_filtered_where(
+        replica_path,
+        search_term=search_term,
+        filter_types=filter_types,
+        filter_disciplines=filter_disciplines,
+        filter_cities=filter_cities,
+        filter_tags=filter_tags,
+        tag_match=tag_match,
+    )
+    query = f"SELECT w.source_country, COUNT(*) {from_clause} WHERE {where_clause} GROUP BY w.source_country"
+    with get_connection(replica_path) as conn:
+        return {row[0]: row[1] for row in conn.execute(query, params).fetchall()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or refresh the global read replica.")
+    parser.add_argument("--db-folder", help="Folder containing the <CODE>.db files")
+    parser.add_argument("--target", help=f"Replica file (default: {GLOBAL_DB_PATH})")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Compare every source database, not only those whose file changed",
+    )
+    args = parser.parse_args()
+    results, errors = refresh_replica(args.db_folder, args.target, full=args.full)
+    for code, changes in results.items():
+        if code in errors:
+            print(f"{code}: failed ({errors[code]})")
+        else:
+            print(f"{code}: {'unchanged' if changes is None else f'{changes} rows changed'}")
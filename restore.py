@@ -0,0 +1,172 @@
+"""Undo deletes and edits recorded in the audit journal.
+
+Deleted organizations are re-inserted from the full records their delete
+or delete_batch entries captured, with their original ids, in one
+transaction per database. Edits are reverted field by field from the
+"changes" of their entry. Restores are themselves recorded in the journal.
+
+    python restore.py entry 42
+    python restore.py batch 3f2a...
+    python restore.py revert 57 [--force]
+"""
+
+import argparse
+from typing import Any, Dict, List, Optional
+
+from audit_journal import DELETE_ACTIONS, audit_journal, audit_writer, make_entry
+from database import get_full_organization_data, insert_organizations, save_organization
+from db_registry import get_available_databases
+
+
+def _database_path(country_code: str, db_folder: Optional[str] = None) -> str:
+    """Get the database file of a country."""
+    databases = get_available_databases(db_folder)
+    if country_code not in databases:
+        raise ValueError(f"No database for {country_code}")
+    return databases[country_code]["path"]
+
+
+def _journal_entries(**filters) -> List[Dict[str, Any]]:
+    """Query the journal after writing any entries still queued."""
+    audit_writer.flush()
+    return audit_journal.query(**filters)
+
+
+def restore_entries(entries: List[Dict[str, Any]], db_folder: Optional[str] = None) -> Dict[str, Dict[str, List[int]]]:
+    """Re-insert the organizations deleted by journal entries.
+
+    Entries are grouped by country and each country is restored in one
+    transaction. Organizations whose id exists again are skipped. Returns
+    {country_code: {"restored": [...], "skipped": [...]}}.
+    """
+    by_country: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in entries:
+        if entry["action"] not in DELETE_ACTIONS:
+            raise ValueError(f"Entry {entry['id']} is an {entry['action']}, not a delete")
+        by_country.setdefault(entry["database"], []).append(entry)
+
+    results = {}
+    for country_code, country_entries in by_country.items():
+        db_path = _database_path(country_code, db_folder)
+        restored, skipped = insert_organizations(
+            db_path, [entry["full_record"] for entry in country_entries]
+        )
+        results[country_code] = {"restored": restored, "skipped": skipped}
+
+        restored_ids = set(restored)
+        audit_writer.submit([
+            make_entry(
+                "restore",
+                country_code,
+                entry["record_id"],
+                entry["organization_name"],
+                {"restored_from": entry["id"]},
+            )
+            for entry in country_entries
+            if entry["record_id"] in restored_ids
+        ])
+    return results
+
+
+def restore_entry(entry_id: int, db_folder: Optional[str] = None) -> Dict[str, Dict[str, List[int]]]:
+    """Restore the organization deleted by one delete entry."""
+    audit_writer.flush()
+    entry = audit_journal.get_entry(entry_id)
+    if entry is None:
+        raise ValueError(f"Audit entry {entry_id} not found")
+    return restore_entries([entry], db_folder)
+
+
+def restore_batch(batch_id: str, db_folder: Optional[str] = None) -> Dict[str, Dict[str, List[int]]]:
+    """Restore every organization of one delete_batch."""
+    entries = _journal_entries(batch_id=batch_id)
+    if not entries:
+        raise ValueError(f"Batch {batch_id} not found")
+    return restore_entries(entries, db_folder)
+
+
+def _value_at(record: Dict[str, Any], key: str) -> Any:
+    """Get a value by its calculate_changes() key, e.g. "tags.disciplines"."""
+    value: Any = record
+    for part in key.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def revert_edit(entry_id: int, force: bool = False, db_folder: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Put back the values an edit entry changed.
+
+    Fields changed again since the edit (to something other than their
+    old value) are a conflict: the revert is refused unless force is set,
+    in which case they are reverted as well.
+    Returns the calculate_changes() diff of the revert.
+    """
+    audit_writer.flush()
+    entry = audit_journal.get_entry(entry_id)
+    if entry is None:
+        raise ValueError(f"Audit entry {entry_id} not found")
+    if entry["action"] != "edit":
+        raise ValueError(f"Entry {entry_id} is an {entry['action']}, not an edit")
+
+    country_code = entry["database"]
+    record_id = entry["record_id"]
+    db_path = _database_path(country_code, db_folder)
+    current = get_full_organization_data(db_path, record_id)
+    if not current:
+        raise ValueError(f"Organization {record_id} no longer exists")
+
+    changes = entry.get("changes", {})
+    conflicts = [
+        key for key, change in changes.items()
+        if _value_at(current, key) not in (change["after"], change["before"])
+    ]
+    if conflicts and not force:
+        raise ValueError(f"Changed since the edit: {', '.join(sorted(conflicts))}")
+
+    # Same shape as the edit form's update: columns plus "tags"/"related" lists
+    update: Dict[str, Any] = {}
+    for key, change in changes.items():
+        section, _, name = key.partition(".")
+        if name and section in ("tags", "related"):
+            update.setdefault(section, {})[name] = change["before"] or []
+        else:
+            update[key] = change["before"]
+
+    before, reverted = save_organization(db_path, record_id, update)
+    if reverted:
+        audit_writer.submit([make_entry(
+            "edit",
+            country_code,
+            record_id,
+            entry["organization_name"],
+            {"full_record_before": before, "changes": reverted, "reverted_from": entry_id},
+        )])
+    return reverted
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Restore deleted organizations or revert edits.")
+    parser.add_argument("--db-folder", help="Folder containing the <CODE>.db files")
+    commands = parser.add_subparsers(dest="command", required=True)
+    entry_parser = commands.add_parser("entry", help="Restore the organization of a delete entry")
+    entry_parser.add_argument("entry_id", type=int)
+    batch_parser = commands.add_parser("batch", help="Restore every organization of a delete_batch")
+    batch_parser.add_argument("batch_id")
+    revert_parser = commands.add_parser("revert", help="Revert an edit entry")
+    revert_parser.add_argument("entry_id", type=int)
+    revert_parser.add_argument("--force", action="store_true", help="Also revert fields changed since")
+    args = parser.parse_args()
+
+    if args.command == "revert":
+        reverted = revert_edit(args.entry_id, force=args.force, db_folder=args.db_folder)
+        print(f"Reverted: {', '.join(sorted(reverted)) or 'nothing to change'}")
+    else:
+        if args.command == "entry":
+            results = restore_entry(args.entry_id, args.db_folder)
+        else:
+            results = restore_batch(args.batch_id, args.db_folder)
+        for code, result in results.items():
+            print(f"{code}: restored {len(result['restored'])}, skipped {len(result['skipped'])} (id in use)")
+    audit_writer.close()
@@ -0,0 +1,87 @@
+"""In-memory inverted index over the organization tag tables.
+
+Each tag value maps to a bitmap of website ids, stored as a Python int with
+bit n set for id n. AND/OR across values and dimensions then run as single
+big-integer operations in C instead of SQL subqueries per filter.
+"""
+
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+
+def ids_to_bitmap(ids: List[int]) -> int:
+    """Pack website ids into an int bitmap."""
+    if not ids:
+        return 0
+    buffer = bytearray(max(ids) // 8 + 1)
+    for website_id in ids:
+        buffer[website_id >> 3] |= 1 << (website_id & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def bitmap_to_ids(bitmap: int) -> List[int]:
+    """Unpack an int bitmap into a sorted list of website ids."""
+    ids = []
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for byte_index, byte in enumerate(data):
+        while byte:
+            low_bit = byte & -byte
+            ids.append(byte_index * 8 + low_bit.bit_length() - 1)
+            byte ^= low_bit
+    return ids
+
+
+class TagIndex:
+    """Tag value -> website id bitmap, per tag dimension."""
+
+    def __init__(self, postings: Dict[str, Dict[str, int]]):
+        self.postings = postings
+
+    @classmethod
+    def build(cls, conn: sqlite3.Connection, tag_tables: Dict[str, Tuple[str, str]]) -> "TagIndex":
+        """Build the index from the tag tables, one scan per table.
+
+        Rows without a website id cannot be indexed and are skipped.
+        """
+        postings = {}
+        for tag_type, (table, column) in tag_tables.items():
+            ids_by_value: Dict[str, List[int]] = {}
+            cursor = conn.execute(f"SELECT website_id, {column} FROM {table} WHERE website_id IS NOT NULL")
+            for website_id, value in cursor:
+                ids_by_value.setdefault(value, []).append(website_id)
+            postings[tag_type] = {
+                value: ids_to_bitmap(ids) for value, ids in ids_by_value.items()
+            }
+        return cls(postings)
+
+    def values(self, tag_type: str) -> List[str]:
+        """Get the distinct values of a tag dimension, sorted."""
+        return sorted(self.postings.get(tag_type, {}))
+
+    def counts(self, tag_type: str, within: Optional[int] = None) -> Dict[str, int]:
+        """Count organizations per value of a tag dimension, optionally within a bitmap."""
+        return {
+            value: (bitmap & within if within is not None else bitmap).bit_count()
+            for value, bitmap in self.postings.get(tag_type, {}).items()
+        }
+
+    def match(self, filter_tags: Dict[str, List[str]], match_all: bool = False) -> int:
+        """Get the bitmap of organizations matching tag filters.
+
+        Dimensions are combined with AND; values within a dimension with OR,
+        or with AND when match_all is set.
+        """
+        result = None
+        for tag_type, values in filter_tags.items():
+            postings = self.postings.get(tag_type, {})
+            bitmaps = [postings.get(value, 0) for value in values]
+            if match_all:
+                dimension = bitmaps[0]
+                for bitmap in bitmaps[1:]:
+                    dimension &= bitmap
+            else:
+                dimension = 0
+                for bitmap in bitmaps:
+                    dimension |= bitmap
+            result = dimension if result is None else result & dimension
+        return result or 0
@@ -1,22 +1,25 @@
 """Logging utilities for Organizations Explorer."""
 
-import json
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from config import LOGS_FOLDER, COUNTRIES
+from audit_journal import audit_journal, audit_writer, batch_entries, make_entry
+from config import AUDIT_ASYNC
 
 
-def ensure_logs_folder():
-    """Ensure logs folder exists."""
-    LOGS_FOLDER.mkdir(parents=True, exist_ok=True)
+def _append(entries: List[Dict[str, Any]]) -> bool:
+    """Write entries to the audit journal, reporting failure instead of raising.
 
-
-def generate_log_filename(country_code: str, action: str) -> str:
-    """Generate log filename with timestamp."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"{timestamp}_{country_code}_{action}.json"
+    With AUDIT_ASYNC the entries are only queued; encoding and the write
+    happen on the audit writer thread.
+    """
+    try:
+        if AUDIT_ASYNC:
+            return audit_writer.submit(entries)
+        audit_journal.append(entries)
+        return True
+    except Exception as e:
+        print(f"Error writing log: {e}")
+        return False
 
 
 def log_edit(
@@ -27,31 +30,13 @@ def log_edit(
     changes: Dict[str, Dict[str, Any]],
 ) -> bool:
     """Log an edit action."""
-    ensure_logs_folder()
-
-    country_name = COUNTRIES.get(country_code, {}).get("name", country_code)
-
-    log_data = {
-        "action": "edit",
-        "timestamp": datetime.now().isoformat(),
-        "database": country_code,
-        "database_name": country_name,
-        "record_id": record_id,
-        "organization_name": organization_name,
-        "full_record_before": full_record_before,
-        "changes": changes,
-    }
-
-    filename = generate_log_filename(country_code, "edit")
-    filepath = LOGS_FOLDER / filename
-
-    try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(log_data, f, indent=2, ensure_ascii=False, default=str)
-        return True
-    except Exception as e:
-        print(f"Error writing log: {e}")
-        return False
+    return _append([make_entry(
+        "edit",
+        country_code,
+        record_id,
+        organization_name,
+        {"full_record_before": full_record_before, "changes": changes},
+    )])
 
 
 def log_delete(
@@ -61,60 +46,25 @@ def log_delete(
     full_record: Dict[str, Any],
 ) -> bool:
     """Log a delete action."""
-    ensure_logs_folder()
-
-    country_name = COUNTRIES.get(country_code, {}).get("name", country_code)
-
-    log_data = {
-        "action": "delete",
-        "timestamp": datetime.now().isoformat(),
-        "database": country_code,
-        "database_name": country_name,
-        "record_id": record_id,
-        "organization_name": organization_name,
-        "full_record": full_record,
-    }
-
-    filename = generate_log_filename(country_code, "delete")
-    filepath = LOGS_FOLDER / filename
-
-    try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(log_data, f, indent=2, ensure_ascii=False, default=str)
-        return True
-    except Exception as e:
-        print(f"Error writing log: {e}")
-        return False
+    return _append([make_entry(
+        "delete",
+        country_code,
+        record_id,
+        organization_name,
+        {"full_record": full_record},
+    )])
 
 
 def log_delete_batch(
     country_code: str,
     records: List[Dict[str, Any]],
+    batch_id: Optional[str] = None,
 ) -> bool:
-    """Log a batch delete action for multiple records."""
-    ensure_logs_folder()
-
-    country_name = COUNTRIES.get(country_code, {}).get("name", country_code)
+    """Log a batch delete action for multiple records.
 
-    log_data = {
-        "action": "delete_batch",
-        "timestamp": datetime.now().isoformat(),
-        "database": country_code,
-        "database_name": country_name,
-        "count": len(records),
-        "records": records,
-    }
-
-    filename = generate_log_filename(country_code, "delete")
-    filepath = LOGS_FOLDER / filename
-
-    try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(log_data, f, indent=2, ensure_ascii=False, default=str)
-        return True
-    except Exception as e:
-        print(f"Error writing log: {e}")
-        return False
+    Pass the same batch_id to log one batch in several calls.
+    """
+    return _append(batch_entries(country_code, records, batch_id=batch_id))
 
 
 def calculate_changes(
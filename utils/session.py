@@ -1,7 +1,7 @@
 """Session state management for Organizations Explorer."""
 
 import streamlit as st
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from config import DEFAULT_PER_PAGE
 
@@ -16,6 +16,13 @@ def init_session_state():
         "filter_types": [],
         "filter_disciplines": [],
         "filter_cities": [],
+        # Theme, audience, geographic and content type filters by tag type
+        "filter_tags": {},
+        "tag_match": "any",
+        # Search every country database instead of the selected one
+        "global_search": False,
+        # Id of the background PDF export started by this session
+        "pdf_export_job": None,
         "sort_column": "name_official",
         "sort_direction": "asc",
         "selected_rows": set(),
@@ -23,10 +30,11 @@ def init_session_state():
         "editing_row": None,
         "delete_confirm": None,
         "delete_multi_confirm": False,
-        # Cache for filter options
-        "cached_types": None,
-        "cached_disciplines": None,
-        "cached_cities": None,
+        "delete_filtered_confirm": False,
+        # Keyset pagination cursors by page number
+        "page_anchors": {},
+        "page_anchors_key": None,
+        "page_anchors_total": None,
     }
 
     for key, value in defaults.items():
@@ -40,6 +48,8 @@ def reset_filters():
     st.session_state.filter_types = []
     st.session_state.filter_disciplines = []
     st.session_state.filter_cities = []
+    st.session_state.filter_tags = {}
+    st.session_state.tag_match = "any"
     st.session_state.current_page = 1
 
 
@@ -51,6 +61,9 @@ def reset_all_state():
     st.session_state.filter_types = []
     st.session_state.filter_disciplines = []
     st.session_state.filter_cities = []
+    st.session_state.filter_tags = {}
+    st.session_state.tag_match = "any"
+    st.session_state.global_search = False
     st.session_state.sort_column = "name_official"
     st.session_state.sort_direction = "asc"
     st.session_state.selected_rows = set()
@@ -58,10 +71,10 @@ def reset_all_state():
     st.session_state.editing_row = None
     st.session_state.delete_confirm = None
     st.session_state.delete_multi_confirm = False
-    # Clear cache
-    st.session_state.cached_types = None
-    st.session_state.cached_disciplines = None
-    st.session_state.cached_cities = None
+    st.session_state.delete_filtered_confirm = False
+    st.session_state.page_anchors = {}
+    st.session_state.page_anchors_key = None
+    st.session_state.page_anchors_total = None
 
 
 def get_current_filters() -> Dict[str, Any]:
@@ -71,9 +84,22 @@ def get_current_filters() -> Dict[str, Any]:
         "filter_types": st.session_state.filter_types or None,
         "filter_disciplines": st.session_state.filter_disciplines or None,
         "filter_cities": st.session_state.filter_cities or None,
+        "filter_tags": {
+            tag_type: values for tag_type, values in st.session_state.filter_tags.items() if values
+        } or None,
+        "tag_match": st.session_state.tag_match,
     }
 
 
+def get_page_anchor_cache(query_key: Tuple) -> Dict[int, Any]:
+    """Get the page -> keyset cursor cache, clearing it when the query changes."""
+    if st.session_state.page_anchors_key != query_key:
+        st.session_state.page_anchors_key = query_key
+        st.session_state.page_anchors = {}
+        st.session_state.page_anchors_total = None
+    return st.session_state.page_anchors
+
+
 def set_sort(column: str):
     """Set sort column, toggle direction if same column."""
     if st.session_state.sort_column == column: